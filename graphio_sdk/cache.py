@@ -0,0 +1,85 @@
+"""
+SDK 내부 캐시 유틸리티 (TTL + LRU)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# get() 에서 "캐시 없음"과 None 값을 구분하기 위한 센티널
+MISSING = object()
+
+
+class TTLCache:
+    """
+    만료 시간(TTL)과 최대 크기(LRU)를 가진 스레드 안전 캐시
+
+    Example:
+        cache = TTLCache(maxsize=512, ttl=30)
+        cache.set(("tag_list",), tags)
+        hit = cache.get(("tag_list",))  # 만료/미등록 시 MISSING
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = 30):
+        """
+        Args:
+            maxsize: 최대 항목 수. 초과 시 가장 오래 사용하지 않은 항목부터 제거
+            ttl: 항목 유효 시간(초). None 또는 0 이하이면 캐시를 사용하지 않음
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부"""
+        return bool(self.ttl) and self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """캐시 조회 - 없거나 만료되었으면 default 반환"""
+        if not self.enabled:
+            return default
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 저장"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """특정 항목 제거"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """
+        캐시 비우기
+
+        Args:
+            predicate: 주어지면 predicate(key)가 True인 항목만 제거
+        """
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+                return
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
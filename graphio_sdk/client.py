@@ -2,11 +2,17 @@
 GraphIO Ontology Service 메인 클라이언트 (자동 리소스 관리)
 """
 import os
+import threading
 
 import requests
 import weakref
 from typing import Dict, Any, Optional, Union, Tuple
 
+from pydantic import TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
+
+from graphio_sdk import json_codec
+from graphio_sdk.cache import TTLCache
 from graphio_sdk.ontology.ontology import OntologyNamespace
 from graphio_sdk.ontology.action_type import ActionTypeNamespace
 from graphio_sdk.ontology.automation import AutomationNamespace
@@ -15,6 +21,11 @@ from graphio_sdk.data_pipline.raw_data import RawDataNamespace
 from graphio_sdk.knowledge_graph.knowledge_graph import KnowledgeGraphNamespace
 
 
+# 호스트당 유지할 keep-alive 커넥션 수
+# bulk_inspect / iter_* 등 동시 요청(기본 16)이 커넥션을 버리지 않고 재사용하도록 맞춤
+_POOL_MAXSIZE = 16
+
+
 class GraphioClient:
     """
     GraphIO Ontology Service 클라이언트
@@ -41,6 +52,9 @@ class GraphioClient:
             self,
             base_url: Optional[str] = None,
             timeout: Union[int, Tuple[int, int]] = 300,
+            cache_ttl: Optional[float] = None,
+            compress_requests: bool = False,
+            id_cache_ttl: Optional[float] = 300,
     ):
         """
         클라이언트 초기화
@@ -53,6 +67,14 @@ class GraphioClient:
                     int인 경우 (5초, timeout초)로 설정되어 서버가 죽어있을 때 빠르게 실패합니다.
                     ActionType 수동 실행은 서버가 실행 종료까지 응답을 붙잡으므로 이 값이 아니라
                     `action_type.EXECUTE_READ_TIMEOUT_SECONDS`를 씁니다.
+            cache_ttl: 읽기 전용 메타데이터 조회(tag_list, owner, kind_list 등) 결과의
+                    캐시 유지 시간(초). 기본값 None이며 None 또는 0이면 캐시하지 않습니다.
+            compress_requests: True이면 큰 Object insert/update/delete/select 요청 본문을
+                    gzip으로 압축해 보냅니다 (Content-Encoding: gzip). 서버가 gzip 요청
+                    본문을 풀어줄 때만 켜세요. 기본값 False.
+            id_cache_ttl: action_type/automation의 이름 -> id 캐시 유지 시간(초).
+                    기본값 300초이며 None 또는 0이면 매 호출마다 이름으로 id를 조회합니다.
+                    캐시된 id로 호출이 실패하면 이름으로 한 번 다시 조회해 재시도합니다.
         """
         # base_url이 None이면 환경변수에서 가져오기
         if base_url is None:
@@ -69,16 +91,58 @@ class GraphioClient:
             self.timeout = timeout
         self._session: Optional[requests.Session] = None
         self._closed = False
-        self.ontology = OntologyNamespace(self)
-        self.action_type = ActionTypeNamespace(self)
-        self.automation = AutomationNamespace(self)
-        self.knowledge_graph = KnowledgeGraphNamespace(self)
-        self.meta_type = MetaTypeNamespace(self)
-        self.raw_data = RawDataNamespace(self)
+        self.compress_requests = compress_requests
+        self.id_cache_ttl = id_cache_ttl
+        # 읽기 전용 GET 응답(파싱된 DTO) 캐시
+        self._response_cache = TTLCache(maxsize=512, ttl=cache_ttl)
+        # 네임스페이스는 처음 접근할 때 생성 (ontology, action_type, ... 프로퍼티)
+        self._namespaces: Dict[str, Any] = {}
+        self._namespace_lock = threading.Lock()
 
         # 가비지 컬렉션 시 자동 정리 등록
         self._register_cleanup()
 
+    def _namespace(self, name: str, factory: type) -> Any:
+        """네임스페이스를 처음 접근할 때 한 번만 생성 (동시 접근 시에도 인스턴스 하나)"""
+        namespace = self._namespaces.get(name)
+        if namespace is None:
+            with self._namespace_lock:
+                namespace = self._namespaces.get(name)
+                if namespace is None:
+                    namespace = factory(self)
+                    self._namespaces[name] = namespace
+        return namespace
+
+    @property
+    def ontology(self) -> OntologyNamespace:
+        """client.ontology 네임스페이스"""
+        return self._namespace("ontology", OntologyNamespace)
+
+    @property
+    def action_type(self) -> ActionTypeNamespace:
+        """client.action_type 네임스페이스"""
+        return self._namespace("action_type", ActionTypeNamespace)
+
+    @property
+    def automation(self) -> AutomationNamespace:
+        """client.automation 네임스페이스"""
+        return self._namespace("automation", AutomationNamespace)
+
+    @property
+    def knowledge_graph(self) -> KnowledgeGraphNamespace:
+        """client.knowledge_graph 네임스페이스"""
+        return self._namespace("knowledge_graph", KnowledgeGraphNamespace)
+
+    @property
+    def meta_type(self) -> MetaTypeNamespace:
+        """client.meta_type 네임스페이스"""
+        return self._namespace("meta_type", MetaTypeNamespace)
+
+    @property
+    def raw_data(self) -> RawDataNamespace:
+        """client.raw_data 네임스페이스"""
+        return self._namespace("raw_data", RawDataNamespace)
+
     def _register_cleanup(self):
         """가비지 컬렉션 시 자동 정리 등록"""
         # weakref를 사용하여 순환 참조 방지
@@ -103,10 +167,75 @@ class GraphioClient:
             raise RuntimeError("클라이언트가 이미 닫혔습니다.")
 
         if self._session is None:
-            self._session = requests.Session()
+            session = requests.Session()
+            # SDK 요청 본문은 모두 JSON - 요청마다 headers를 넘기지 않고 세션 기본값으로 둠
+            session.headers["Content-Type"] = "application/json"
+            adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
 
         return self._session
 
+    def _get_content(self, url: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """GET 요청 후 응답 본문(bytes) 반환 (HTTP 에러 시 예외)"""
+        response = self._get_session().get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
+
+    def _get_json(
+            self,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            operation: Optional[str] = None,
+    ) -> Any:
+        """
+        GET 요청 -> JSON 파싱 -> 응답 검증
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            operation: 지정 시 _check_response(result, operation)으로 검증
+
+        Returns:
+            파싱된 응답 전체 (래퍼 포함)
+        """
+        result = json_codec.loads(self._get_content(url, params))
+        if operation is not None:
+            self._check_response(result, operation)
+        return result
+
+    def _get_envelope(
+            self,
+            adapter: TypeAdapter,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            operation: Optional[str] = None,
+    ) -> Any:
+        """
+        GET 요청 -> 응답 래퍼(_ResponseEnvelope) TypeAdapter로 바로 파싱 -> 응답 검증
+
+        정상 응답은 validate_json 한 번으로 파싱합니다. 검증에 실패하면 dict로 다시 파싱해
+        status/error를 먼저 확인하므로 에러 응답은 API 에러 메시지로 실패하고,
+        data 자체의 형식만 다른 성공 응답(예: 목록 대신 {})은 data 없는 래퍼로 반환합니다.
+        """
+        content = self._get_content(url, params)
+        try:
+            envelope = adapter.validate_json(content)
+        except ValidationError as exc:
+            result = json_codec.loads(content)
+            if not isinstance(result, dict):
+                raise
+            if operation is not None:
+                self._check_response(result, operation)
+            # data 안쪽 항목의 검증 실패는 그대로 전달
+            if any(error["loc"] != ("data",) for error in exc.errors()):
+                raise
+            return adapter.validate_python({k: v for k, v in result.items() if k != "data"})
+        if operation is not None:
+            self._check_response(envelope.status_dict(), operation)
+        return envelope
+
     # ========================================================================
     # 유틸리티
     # ========================================================================
@@ -142,6 +271,9 @@ class GraphioClient:
             if self._session:
                 self._session.close()
                 self._session = None
+            ontology = self._namespaces.get("ontology")
+            if ontology is not None:
+                ontology.close()
             self._closed = True
 
     def __enter__(self):
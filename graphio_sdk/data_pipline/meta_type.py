@@ -2,8 +2,25 @@
 MetaType 네임스페이스 - GraphIOClient와 함께 사용
 """
 
-from typing import Any, Dict, List, TYPE_CHECKING
+import copy
+import functools
+import inspect
+import itertools
+import math
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
+from pydantic import TypeAdapter
+
+try:
+    import ijson
+except ImportError:  # 선택 의존성: pip install "graphio-sdk[streaming]"
+    ijson = None
+
+from graphio_sdk.cache import MISSING
 from graphio_sdk.schema import (
     MetaTypeDto,
     MetaTypeInspectDto,
@@ -12,45 +29,234 @@ from graphio_sdk.schema import (
     TagDto,
     MappedRawDataResponseDto,
 )
+from graphio_sdk.schema.meta_type_schema import _ResponseEnvelope
 
 if TYPE_CHECKING:
     from graphio_sdk.client import GraphioClient
 
 
+# 응답 파싱용 TypeAdapter 대상 타입 - 스키마 구성은 첫 사용 시 1회만 수행 (_adapter 참고)
+# (envelope 포함 항목은 {"status", "error", "data": [...]} 래퍼째 파싱)
+_ADAPTER_TYPES: Dict[str, Callable[[], Any]] = {
+    "meta_list": lambda: _ResponseEnvelope[List[MetaTypeDto]],
+    "raw_list": lambda: _ResponseEnvelope[List[MappedRawDataResponseDto]],
+    "prop_list": lambda: _ResponseEnvelope[List[MetaTypePropertyResponseDto]],
+    "tag_list": lambda: _ResponseEnvelope[List[TagDto]],
+    "kind_list": lambda: List[MetaTypeInspectDto],
+    "rawinfo_list": lambda: List[RawDataInfoResponseDto],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _adapter(name: str) -> TypeAdapter:
+    """
+    이름에 해당하는 TypeAdapter 반환 (최초 호출 시 생성)
+
+    all_data 등 dict 응답만 쓰는 경우 import 시점에 검증 스키마를 만들지 않도록 지연 생성합니다.
+    """
+    return TypeAdapter(_ADAPTER_TYPES[name]())
+
+
+# inspect_all / bulk_inspect 에서 한 번에 조회하는 inspect 엔드포인트 (결과 키 -> 메서드명)
+_INSPECT_METHODS = (
+    ("property", "inspect_property"),
+    ("profiling", "inspect_profiling"),
+    ("data_source", "inspect_data_source"),
+    ("basic", "inspect_basic"),
+)
+
+
+# 응답 캐시 키 접두사 (MetaTypeNamespace.invalidate_cache 에서 사용)
+_CACHE_PREFIX = "meta_type"
+
+
+def _cached(endpoint: str):
+    """
+    읽기 전용 GET 메서드의 파싱 결과를 client 응답 캐시(TTL)에 보관하는 데코레이터
+
+    키는 (endpoint, 인자 이름/값)이며 위치/키워드 어느 쪽으로 호출해도 같은 키가 됩니다.
+    반환 시 깊은 복사본을 돌려주어 호출자가 리스트나 그 안의 DTO/dict를 수정해도 캐시가
+    오염되지 않습니다. 캐시가 꺼져 있으면(cache_ttl 미지정) 키 구성과 복사 없이 바로 호출합니다.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = self._client._response_cache
+            if not cache.enabled:
+                return func(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            # 첫 인자(self)는 키에서 제외
+            key = (_CACHE_PREFIX, endpoint, tuple(bound.arguments.items())[1:])
+            value = cache.get(key)
+            if value is MISSING:
+                value = func(self, *args, **kwargs)
+                cache.set(key, value)
+            return copy.deepcopy(value)
+        return wrapper
+    return decorator
+
+
+def _iter_envelope_values(stream: Any) -> Iterator[Tuple[str, Any]]:
+    """
+    응답 래퍼 JSON 스트림을 ijson으로 파싱하며 ("status" | "error" | "data.item", 값)을 순서대로 반환
+
+    data 행과 error 객체는 완성되는 대로 하나씩 반환하므로 전체 응답을 메모리에 올리지 않습니다.
+    """
+    builder = None  # data 행 / error 객체를 구성 중인 ObjectBuilder
+    builder_prefix = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == builder_prefix and event in ("end_map", "end_array"):
+                yield prefix, builder.value
+                builder = None
+        elif prefix in ("data.item", "error"):
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder_prefix = prefix
+                builder.event(event, value)
+            else:
+                yield prefix, value
+        elif prefix == "status":
+            yield prefix, value
+
+
+def _iter_pages(
+        fetch_page: Callable[[int], Tuple[List[Any], Optional[int]]],
+        size: int,
+        max_workers: int,
+) -> Iterator[Any]:
+    """
+    0-base 페이지 API를 순서대로 끝까지 순회
+
+    0페이지로 전체 건수(totalSize)를 확인한 뒤 나머지 페이지는 스레드 풀에서 동시에
+    조회합니다. 미리 받아 두는 페이지는 max_workers * 2개까지이며, 한 페이지를 꺼낼 때마다
+    다음 페이지를 요청하므로 호출자가 천천히 소비해도 전체 테이블을 메모리에 올리지 않습니다.
+    전체 건수를 알 수 없으면 size보다 짧은 페이지가 나올 때까지 순차 조회합니다.
+
+    Args:
+        fetch_page: page -> (항목 리스트, 전체 건수 또는 None)
+        size: 페이지 크기
+        max_workers: 동시 요청 수 상한
+    """
+    items, total_size = fetch_page(0)
+    yield from items
+
+    if total_size is None:
+        page = 1
+        while len(items) >= size > 0:
+            items, _ = fetch_page(page)
+            yield from items
+            page += 1
+        return
+
+    total_pages = math.ceil(total_size / size) if size > 0 else 1
+    if total_pages <= 1:
+        return
+
+    max_workers = max(1, max_workers)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pages = iter(range(1, total_pages))
+    try:
+        # 제출 순서대로 꺼내므로 페이지 순서가 유지됨
+        pending = deque(
+            executor.submit(fetch_page, page) for page in itertools.islice(pages, max_workers * 2)
+        )
+        while pending:
+            items, _ = pending.popleft().result()
+            page = next(pages, None)
+            if page is not None:
+                pending.append(executor.submit(fetch_page, page))
+            yield from items
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 # ============================
 # 리소스별 래퍼
 # ============================
 class MetaTableAPI:
     """메타타입 테이블을 조작하는 래퍼 (GraphioClient 세션 사용)"""
 
+    __slots__ = (
+        "_client",
+        "_url",
+        "_url_all_data",
+        "_url_meta_type_table",
+        "_url_table_list",
+        "_url_table_columns",
+        "_url_sample_data",
+    )
+
     def __init__(self, client: "GraphioClient"):
         self._client = client
         self._url = f"{self._client.api_base}/meta-type"
+        # 엔드포인트 URL은 client별로 고정이므로 한 번만 구성 (경로 변수가 있는 것은 prefix)
+        self._url_all_data = self._url + "/all-data"
+        self._url_meta_type_table = self._url + "/meta-type-table/"
+        self._url_table_list = self._url + "/table-list"
+        self._url_table_columns = self._url + "/table-columns"
+        self._url_sample_data = self._url + "/inspect/sample-data-param"
 
     def all_data(self, meta_type_id: str) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "metaTypeId": meta_type_id,
         }
-        url = f"{self._url}/all-data"
-        response = self._client._get_session().get(
-            url, params=params, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
+        url = self._url_all_data
+        result = self._client._get_json(url, params=params, operation="list all-data")
         data = result.get("data", [])
         total_count = result.get("totalSize", None)
-        self._client._check_response(result, "list all-data")
         return {"data": data, "totalCount": total_count}
 
-    def meta_type_table(self, meta_type_id: str) -> Dict[str, Any]:
-        """GET /meta-type-table/{meta-type-id} : Map<String, Object>"""
-        url = f"{self._url}/meta-type-table/{meta_type_id}"
+    def iter_all_data(self, meta_type_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        all-data 응답의 data 행을 하나씩 반환
+
+        ijson이 설치되어 있으면 응답을 받는 대로 파싱하므로 전체 응답을 메모리에 올리지 않고,
+        첫 행도 응답이 끝나기 전에 나옵니다. 없으면 all_data()로 한 번에 받아서 순회합니다.
+        totalSize가 필요하면 all_data()를 사용하세요.
+
+        status/error는 파싱되는 즉시 검증합니다. 에러 응답이면 그 뒤의 행은 반환하지 않고
+        예외가 발생합니다. 단, 서버가 status/error를 data 뒤에 보내면 그 전에 나온 행은
+        이미 반환된 뒤이며 예외는 마지막 행 다음에 발생합니다.
+
+        Example:
+            for row in client.meta_type.table_data.iter_all_data(meta_type_id):
+                print(row)
+        """
+        if ijson is None:
+            yield from self.all_data(meta_type_id)["data"]
+            return
+
+        params: Dict[str, Any] = {
+            "metaTypeId": meta_type_id,
+        }
         response = self._client._get_session().get(
-            url, timeout=self._client.timeout
+            self._url_all_data, params=params, timeout=self._client.timeout, stream=True
         )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "list meta type table")
+        with response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # gzip/br 등 Content-Encoding 해제
+            envelope: Dict[str, Any] = {}
+            for key, value in _iter_envelope_values(response.raw):
+                if key == "data.item":
+                    if envelope.get("status") is not False:
+                        yield value
+                    continue
+                envelope[key] = value
+                if key == "error":
+                    self._client._check_response(envelope, "list all-data")
+        # error 없이 status만 false였던 경우
+        self._client._check_response(envelope, "list all-data")
+
+    @_cached("meta_type_table")
+    def meta_type_table(self, meta_type_id: str) -> Dict[str, Any]:
+        """GET /meta-type-table/{meta-type-id} : Map<String, Object>"""
+        url = self._url_meta_type_table + meta_type_id
+        result = self._client._get_json(url, operation="list meta type table")
         return result.get("data", {})
 
     def table_list(
@@ -61,75 +267,94 @@ class MetaTableAPI:
             "schemaName": schema_name,
             "metaTypeKind": meta_type_kind
         }
-        url = f"{self._url}/table-list"
-        response = self._client._get_session().get(
-            url, params=params, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "list table from schema")
+        url = self._url_table_list
+        result = self._client._get_json(url, params=params, operation="list table from schema")
         return result.get("data", [])
 
+    @_cached("table_columns")
     def table_columns(self, connection_instance_id: str, schema_name: str, table_name: str) -> List[Dict[str, Any]]:
         params: Dict[str, Any] = {
             "connectionInstanceId": connection_instance_id,
             "schemaName": schema_name,
             "tableName": table_name
         }
-        url = f"{self._url}/table-columns"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout, params=params
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "table columns")
+        url = self._url_table_columns
+        result = self._client._get_json(url, params=params, operation="table columns")
         return result.get("data", [])
 
     def sample_data_param(
             self, meta_type_id: str, page: int, size: int
     ) -> List[Dict[str, Any]]:
+        return self._sample_data_page(meta_type_id, page, size)[0]
+
+    def iter_sample_data(
+            self, meta_type_id: str, size: int = 100, max_workers: int = 8
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        sample_data_param 전체 페이지를 순서대로 순회 (2페이지 이후는 동시 조회)
+
+        Example:
+            for row in client.meta_type.table_data.iter_sample_data(meta_type_id, size=500):
+                ...
+        """
+        return _iter_pages(
+            lambda page: self._sample_data_page(meta_type_id, page, size),
+            size=size,
+            max_workers=max_workers,
+        )
+
+    def _sample_data_page(
+            self, meta_type_id: str, page: int, size: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """sample-data-param 한 페이지 조회 -> (data, totalSize)"""
         params: Dict[str, Any] = {
             "metaTypeId": meta_type_id,
             "page": page,
             "size": size
         }
-        url = f"{self._url}/inspect/sample-data-param"
-        response = self._client._get_session().get(
-            url, params=params, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "sample data")
-        return result.get("data", [])
+        url = self._url_sample_data
+        result = self._client._get_json(url, params=params, operation="sample data")
+        return result.get("data", []), result.get("totalSize")
 
 
 class MetaManageAPI:
     """메타타입을 관리하는 래퍼"""
 
+    __slots__ = (
+        "_client",
+        "_url",
+        "_url_duplicate_check",
+        "_url_raw_datas",
+        "_url_owner",
+        "_url_kind_list",
+        "_url_inspect_property",
+        "_url_inspect_profiling",
+        "_url_inspect_data_source",
+        "_url_inspect_basic",
+    )
+
     def __init__(self, client: "GraphioClient"):
         self._client = client
         self._url = f"{self._client.api_base}/meta-type"
+        # 엔드포인트 URL은 client별로 고정이므로 한 번만 구성 (경로 변수가 있는 것은 prefix)
+        self._url_duplicate_check = self._url + "/duplicate-check/"
+        self._url_raw_datas = self._url + "/raw-datas"
+        self._url_owner = self._url + "/owner"
+        self._url_kind_list = self._url + "/kind-list"
+        self._url_inspect_property = self._url + "/inspect/property/"
+        self._url_inspect_profiling = self._url + "/inspect/profiling/"
+        self._url_inspect_data_source = self._url + "/inspect/data-source/"
+        self._url_inspect_basic = self._url + "/inspect/basic/"
 
     def list(self) -> List[MetaTypeDto]:
         """GET / : List<MetaTypeDto>"""
-        url = f"{self._url}"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "list all-meta")
-        data = result.get("data", [])
-        return [MetaTypeDto.model_validate(item) for item in data] if isinstance(data, list) else []
+        url = self._url
+        envelope = self._client._get_envelope(_adapter("meta_list"), url, operation="list all-meta")
+        return envelope.data or []
 
     def duplicate_check(self, meta_type_name: str) -> Dict[str, Any]:
-        url = f"{self._url}/duplicate-check/{meta_type_name}"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "check meta_type name duplicate")
+        url = self._url_duplicate_check + meta_type_name
+        result = self._client._get_json(url, operation="check meta_type name duplicate")
         data = dict(result.get("data", result))
         status = result.get("status", None)
         return {"meta_type_id": data.get("id"), "status": status}
@@ -137,113 +362,202 @@ class MetaManageAPI:
     def raw_datas(
             self, meta_type_id: str, page: int, size: int
     ) -> List[MappedRawDataResponseDto]:
+        return self._raw_datas_page(meta_type_id, page, size)[0]
+
+    def iter_raw_datas(
+            self, meta_type_id: str, size: int = 100, max_workers: int = 8
+    ) -> Iterator[MappedRawDataResponseDto]:
+        """
+        raw_datas 전체 페이지를 순서대로 순회 (2페이지 이후는 동시 조회)
+
+        Example:
+            for raw in client.meta_type.manage.iter_raw_datas(meta_type_id, size=200):
+                print(raw.name)
+        """
+        return _iter_pages(
+            lambda page: self._raw_datas_page(meta_type_id, page, size),
+            size=size,
+            max_workers=max_workers,
+        )
+
+    def _raw_datas_page(
+            self, meta_type_id: str, page: int, size: int
+    ) -> Tuple[List[MappedRawDataResponseDto], Optional[int]]:
+        """raw-datas 한 페이지 조회 -> (DTO 리스트, totalSize)"""
         params: Dict[str, Any] = {
             "metaTypeId": meta_type_id,
             "page": page,
             "size": size
         }
-        url = f"{self._url}/raw-datas"
-        response = self._client._get_session().get(
-            url, params=params, timeout=self._client.timeout
+        url = self._url_raw_datas
+        envelope = self._client._get_envelope(
+            _adapter("raw_list"),
+            url,
+            params=params,
+            operation="list raw data by meta type id"
         )
-        response.raise_for_status()
-        result = response.json()
-        data = result.get("data", result)
-        self._client._check_response(result, "list raw data by meta type id")
-        return [MappedRawDataResponseDto.model_validate(item) for item in data] if isinstance(data, list) else []
+        return envelope.data or [], envelope.total_size
 
+    @_cached("owner")
     def owner(self) -> List[str]:
         """GET /owner : List<UUID>"""
-        url = f"{self._url}/owner"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "list meta type owner")
+        url = self._url_owner
+        result = self._client._get_json(url, operation="list meta type owner")
         data = result.get("data", [])
-        return [str(x) for x in data] if isinstance(data, list) else []
+        if not isinstance(data, list):
+            return []
+        # JSON의 UUID는 이미 문자열이므로 그대로 반환 (_cached가 복사본을 돌려줌)
+        if not data or isinstance(data[0], str):
+            return data
+        return list(map(str, data))
 
+    @_cached("kind_list")
     def kind_list(self, meta_type_kind: str) -> List[MetaTypeInspectDto]:
         """GET /kind-list : List<MetaTypeInspectDto>"""
         params: Dict[str, Any] = {
             "metaTypeKind": meta_type_kind
         }
-        url = f"{self._url}/kind-list"
-        response = self._client._get_session().get(
-            url, params=params, timeout=self._client.timeout
+        url = self._url_kind_list
+        result = self._client._get_json(
+            url,
+            params=params,
+            operation="list meta type by meta type kind"
         )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "list meta type by meta type kind")
-        return [MetaTypeInspectDto.model_validate(item) for item in result] if isinstance(result, list) else []
+        return _adapter("kind_list").validate_python(result) if isinstance(result, list) else []
 
     def inspect_property(
             self, meta_type_id: str
     ) -> List[MetaTypePropertyResponseDto]:
         """GET /inspect/property/{meta-type-id} : List<MetaTypePropertyResponseDto>"""
-        url = f"{self._url}/inspect/property/{meta_type_id}"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "meta type propreties")
-        data = result.get("data", [])
-        return [MetaTypePropertyResponseDto.model_validate(item) for item in data] if isinstance(data, list) else []
+        url = self._url_inspect_property + meta_type_id
+        envelope = self._client._get_envelope(_adapter("prop_list"), url, operation="meta type propreties")
+        return envelope.data or []
 
     def inspect_profiling(self, meta_type_id: str) -> List[Dict[str, Any]]:
         """GET /inspect/profiling/{meta-type-id} : List<Map<String, Object>>"""
-        url = f"{self._url}/inspect/profiling/{meta_type_id}"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "meta type profiling")
+        url = self._url_inspect_profiling + meta_type_id
+        result = self._client._get_json(url, operation="meta type profiling")
         return result.get("data", [])
 
     def inspect_data_source(
             self, meta_type_id: str
     ) -> List[RawDataInfoResponseDto]:
         """GET /inspect/data-source/{meta-type-id} : List<RawDataInfoResponseDto>"""
-        url = f"{self._url}/inspect/data-source/{meta_type_id}"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        return [RawDataInfoResponseDto.model_validate(item) for item in result] if isinstance(result, list) else []
+        url = self._url_inspect_data_source + meta_type_id
+        result = self._client._get_json(url)
+        return _adapter("rawinfo_list").validate_python(result) if isinstance(result, list) else []
 
     def inspect_basic(self, meta_type_id: str) -> MetaTypeInspectDto:
         """GET /inspect/basic/{meta-type-id} : MetaTypeInspectDto"""
-        url = f"{self._url}/inspect/basic/{meta_type_id}"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "meta type basic inspect")
+        url = self._url_inspect_basic + meta_type_id
+        result = self._client._get_json(url, operation="meta type basic inspect")
         return MetaTypeInspectDto.model_validate(result) if isinstance(result, dict) else MetaTypeInspectDto.model_validate(
             {})
 
+    def inspect_all(self, meta_type_id: str) -> Dict[str, Any]:
+        """
+        하나의 메타타입에 대한 inspect 엔드포인트 4종을 동시에 조회
+
+        property / profiling / data-source / basic 요청은 서로 독립적이므로
+        세션 커넥션 풀 위에서 병렬로 보내 왕복 지연을 겹칩니다.
+
+        Returns:
+            {"property": List[MetaTypePropertyResponseDto],
+             "profiling": List[Dict[str, Any]],
+             "data_source": List[RawDataInfoResponseDto],
+             "basic": MetaTypeInspectDto}
+        """
+        return self.bulk_inspect([meta_type_id], max_workers=len(_INSPECT_METHODS))[meta_type_id]
+
+    def bulk_inspect(
+            self, meta_type_ids: List[str], max_workers: int = 16
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 메타타입의 inspect 결과를 동시에 조회
+
+        Args:
+            meta_type_ids: 조회할 메타타입 ID 목록
+            max_workers: 동시 요청 수 상한
+
+        Returns:
+            {meta_type_id: inspect_all(meta_type_id) 와 같은 형태의 dict}
+            하나라도 실패하면 해당 예외를 그대로 전파합니다.
+        """
+        ids = list(dict.fromkeys(meta_type_ids))
+        if not ids:
+            return {}
+
+        results: Dict[str, Dict[str, Any]] = {meta_type_id: {} for meta_type_id in ids}
+        with self.batched(max_workers=max_workers) as batch:
+            futures = [
+                (meta_type_id, key, batch.submit(method_name, meta_type_id))
+                for meta_type_id in ids
+                for key, method_name in _INSPECT_METHODS
+            ]
+        for meta_type_id, key, future in futures:
+            results[meta_type_id][key] = future.result()
+        return results
+
+    @contextmanager
+    def batched(self, max_workers: int = 16) -> Iterator["MetaManageBatch"]:
+        """
+        반복 호출을 동시 요청으로 묶는 배치 컨텍스트
+
+        블록 안에서 호출한 메서드는 즉시 Future를 반환하고, 요청은 워커 스레드에서
+        동시에 실행됩니다. 블록을 빠져나올 때 모든 요청이 끝날 때까지 기다립니다.
+
+        Example:
+            with client.meta_type.manage.batched() as batch:
+                futures = [batch.inspect_basic(i) for i in meta_type_ids]
+            basics = [f.result() for f in futures]
+        """
+        batch = MetaManageBatch(self, max_workers=max_workers)
+        try:
+            yield batch
+        finally:
+            batch.close()
+
+
+class MetaManageBatch:
+    """MetaManageAPI.batched() 블록 안에서 사용하는 핸들 (메서드 호출 -> Future)"""
+
+    def __init__(self, manage: MetaManageAPI, max_workers: int = 16):
+        self._manage = manage
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+
+    def submit(self, method_name: str, *args: Any, **kwargs: Any) -> Future:
+        """MetaManageAPI 메서드를 이름으로 예약하고 Future 반환"""
+        return self._executor.submit(getattr(self._manage, method_name), *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Callable[..., Future]:
+        if name.startswith("_") or not callable(getattr(self._manage, name, None)):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        def _submit(*args: Any, **kwargs: Any) -> Future:
+            return self.submit(name, *args, **kwargs)
+
+        return _submit
+
+    def close(self):
+        """예약된 요청이 모두 끝날 때까지 대기 후 워커 정리"""
+        self._executor.shutdown(wait=True)
+
 
 class EtcAPI:
+    __slots__ = ("_client", "_url", "_url_tag_list")
+
     def __init__(self, client: "GraphioClient"):
         self._client = client
         self._url = f"{self._client.api_base}/meta-type"
+        # 엔드포인트 URL은 client별로 고정이므로 한 번만 구성 (경로 변수가 있는 것은 prefix)
+        self._url_tag_list = self._url + "/tag-list"
 
+    @_cached("tag_list")
     def tag_list(self) -> List[TagDto]:
         """GET /tag-list : List<TagDto>"""
-        url = f"{self._url}/tag-list"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "get tag list")
-        data = result.get("data", [])
-        return [TagDto.model_validate(item) for item in data] if isinstance(data, list) else []
+        url = self._url_tag_list
+        envelope = self._client._get_envelope(_adapter("tag_list"), url, operation="get tag list")
+        return envelope.data or []
 
 
 # ============================
@@ -255,15 +569,47 @@ class MetaTypeNamespace:
     GraphIOClient와 함께 사용: client.meta_type.table_data.list() 등
     """
 
+    __slots__ = ("_client", "_table_data", "_manage", "_etc", "_lock")
+
     def __init__(self, client: "GraphioClient"):
         self._client = client
-        self.table_data = MetaTableAPI(client)
-        self.manage = MetaManageAPI(client)
-        self.etc = EtcAPI(client)
+        # 하위 API는 첫 접근 시 생성
+        self._table_data: Optional[MetaTableAPI] = None
+        self._manage: Optional[MetaManageAPI] = None
+        self._etc: Optional[EtcAPI] = None
+        self._lock = threading.Lock()
+
+    def _sub_api(self, slot: str, factory: type) -> Any:
+        """하위 API를 처음 접근할 때 한 번만 생성 (동시 접근 시에도 인스턴스 하나)"""
+        api = getattr(self, slot)
+        if api is None:
+            with self._lock:
+                api = getattr(self, slot)
+                if api is None:
+                    api = factory(self._client)
+                    setattr(self, slot, api)
+        return api
+
+    @property
+    def table_data(self) -> MetaTableAPI:
+        return self._sub_api("_table_data", MetaTableAPI)
+
+    @property
+    def manage(self) -> MetaManageAPI:
+        return self._sub_api("_manage", MetaManageAPI)
+
+    @property
+    def etc(self) -> EtcAPI:
+        return self._sub_api("_etc", EtcAPI)
+
+    def invalidate_cache(self):
+        """tag_list / owner / kind_list / meta_type_table / table_columns 캐시 제거"""
+        self._client._response_cache.clear(lambda key: key[0] == _CACHE_PREFIX)
 
 
 __all__ = [
     "MetaTableAPI",
     "MetaManageAPI",
+    "MetaManageBatch",
     "MetaTypeNamespace",
 ]
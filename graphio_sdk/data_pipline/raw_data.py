@@ -2,14 +2,29 @@
 Raw Data 네임스페이스 - GraphIOClient와 함께 사용
 """
 
+import functools
 from typing import TYPE_CHECKING, List, Optional
 
+from pydantic import TypeAdapter
+
+from graphio_sdk.schema.meta_type_schema import _ResponseEnvelope
 from graphio_sdk.schema.raw_data_schema import RawDataListItemDto, RawDataSourceInfoDto
 
 if TYPE_CHECKING:
     from graphio_sdk.client import GraphioClient
 
 
+# 응답 파싱용 TypeAdapter - 스키마 구성은 첫 사용 시 1회만 수행
+@functools.lru_cache(maxsize=None)
+def _list_items_adapter() -> TypeAdapter:
+    return TypeAdapter(_ResponseEnvelope[List[RawDataListItemDto]])
+
+
+@functools.lru_cache(maxsize=None)
+def _source_info_adapter() -> TypeAdapter:
+    return TypeAdapter(_ResponseEnvelope[RawDataSourceInfoDto])
+
+
 class RawDataNamespace:
     """
     client.raw_data 네임스페이스.
@@ -68,18 +83,10 @@ class RawDataNamespace:
             "query": query,
         }
         params = {k: v for k, v in params.items() if v is not None}
-        response = self._client._get_session().get(
-            self._url, params=params, timeout=self._client.timeout
-        )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "list raw data")
-        data = result.get("data", [])
-        return (
-            [RawDataListItemDto.model_validate(item) for item in data]
-            if isinstance(data, list)
-            else []
+        envelope = self._client._get_envelope(
+            _list_items_adapter(), self._url, params=params, operation="list raw data"
         )
+        return envelope.data or []
 
     def source_info(self, raw_data_id: str) -> RawDataSourceInfoDto:
         """
@@ -95,14 +102,10 @@ class RawDataNamespace:
                 table이면 location(databaseName, schemaName, tableName) 포함
         """
         url = f"{self._url}/{raw_data_id}/source-info"
-        response = self._client._get_session().get(
-            url, timeout=self._client.timeout
+        envelope = self._client._get_envelope(
+            _source_info_adapter(), url, operation="get raw data source info"
         )
-        response.raise_for_status()
-        result = response.json()
-        self._client._check_response(result, "get raw data source info")
-        data = result.get("data", {})
-        return RawDataSourceInfoDto.model_validate(data) if isinstance(data, dict) else RawDataSourceInfoDto()
+        return envelope.data or RawDataSourceInfoDto()
 
 
 __all__ = ["RawDataNamespace"]
@@ -0,0 +1,44 @@
+"""
+SDK 내부 JSON 인코딩/디코딩
+
+orjson이 설치되어 있으면 orjson을, 없으면 pydantic-core 파서 / 표준 json을 사용합니다.
+두 경우 모두 bytes(response.content)를 str 디코딩 없이 바로 파싱합니다.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: pip install "graphio-sdk[fast-json]"
+    orjson = None
+
+from pydantic_core import from_json
+
+
+def loads(data: bytes) -> Any:
+    """JSON bytes -> Python 객체"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return from_json(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Python 객체 -> JSON bytes (요청 본문용, 공백 없는 UTF-8)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # 64비트를 넘는 정수 등 orjson이 지원하지 않는 값은 표준 json으로
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Python 객체 -> 들여쓰기(2칸) JSON 문자열 (출력/로그용, 비ASCII 문자 그대로)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
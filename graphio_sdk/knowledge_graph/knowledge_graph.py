@@ -2,8 +2,11 @@
 KnowledgeGraph 네임스페이스 - GraphioClient와 함께 사용
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
+from graphio_sdk import json_codec
+
 if TYPE_CHECKING:
     from graphio_sdk.client import GraphioClient
 
@@ -19,6 +22,12 @@ class KnowledgeGraphNamespace:
     _MIN_HOP = 0
     _MAX_HOP = 10
 
+    # batch()에서 사용하는 op 이름 -> 메서드 이름
+    _BATCH_OPS = {
+        "by_object_type_name": "graph_by_object_type_name",
+        "by_object_and_link_types": "graph_by_object_and_link_types",
+    }
+
     def __init__(self, client: "GraphioClient"):
         self._client = client
         self._ontology_url = f"{self._client.api_base}/ontology"
@@ -62,7 +71,7 @@ class KnowledgeGraphNamespace:
             url, params={"hop": hop}, timeout=self._client.timeout
         )
         response.raise_for_status()
-        result = response.json()
+        result = json_codec.loads(response.content)
         self._client._check_response(result, "knowledge graph by object type name")
         return result.get("data", {})
 
@@ -91,14 +100,51 @@ class KnowledgeGraphNamespace:
         }
         response = self._client._get_session().post(
             url,
-            json=request_body,
-            headers={"Content-Type": "application/json"},
+            data=json_codec.dumps(request_body),
             timeout=self._client.timeout,
         )
         response.raise_for_status()
-        result = response.json()
+        result = json_codec.loads(response.content)
         self._client._check_response(result, "knowledge graph by object/link type list")
         return result.get("data", {})
 
+    def batch(self, queries: List[Dict[str, Any]], max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        여러 graph 조회를 동시에 실행.
+
+        서버에 일괄 조회 API가 없으므로 요청은 각각 보내되, 클라이언트 세션의
+        keep-alive 커넥션 위에서 병렬로 실행해 전체 소요 시간을 가장 느린 조회 수준으로 줄입니다.
+
+        Args:
+            queries: {"op": "by_object_type_name" | "by_object_and_link_types", ...인자} 목록
+            max_workers: 동시 요청 수 상한
+
+        Returns:
+            queries 순서대로의 graph 데이터 목록. 하나라도 실패하면 해당 예외를 전파합니다.
+
+        Example:
+            by_name, by_list = client.knowledge_graph.batch([
+                {"op": "by_object_type_name", "object_type_name": "용역계약업체", "hop": 1},
+                {"op": "by_object_and_link_types",
+                 "object_type_id_list": [...], "link_type_id_list": [...]},
+            ])
+        """
+        calls = []
+        for query in queries:
+            kwargs = dict(query)
+            op = kwargs.pop("op", None)
+            method_name = self._BATCH_OPS.get(op)
+            if method_name is None:
+                raise ValueError(
+                    f"지원하지 않는 op입니다: {op} (가능한 값: {list(self._BATCH_OPS)})"
+                )
+            calls.append((getattr(self, method_name), kwargs))
+        if not calls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(calls)))) as executor:
+            futures = [executor.submit(method, **kwargs) for method, kwargs in calls]
+        return [future.result() for future in futures]
+
 
 __all__ = ["KnowledgeGraphNamespace"]
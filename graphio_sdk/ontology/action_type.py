@@ -2,7 +2,13 @@
 ActionType 네임스페이스 - GraphioClient와 함께 사용
 """
 
-from typing import List, Any, Dict, Optional, Tuple, TYPE_CHECKING, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Any, Callable, Dict, Optional, Tuple, TYPE_CHECKING, TypeVar, Union
+
+from requests import HTTPError, RequestException
+
+from graphio_sdk import json_codec
+from graphio_sdk.cache import MISSING, TTLCache
 
 if TYPE_CHECKING:
     from graphio_sdk.client import GraphioClient
@@ -14,6 +20,8 @@ if TYPE_CHECKING:
 # 600초 침묵 후 응답하는 이 패턴에 정확히 걸린다. 그래서 서버보다 길게 잡는다.
 EXECUTE_READ_TIMEOUT_SECONDS = 620
 
+T = TypeVar("T")
+
 
 class ActionTypeNamespace:
     """
@@ -25,6 +33,12 @@ class ActionTypeNamespace:
     def __init__(self, client: "GraphioClient"):
         self._client = client
         self._url = f"{self._client.api_base}/ontology-workflow/action-type"
+        # 엔드포인트 URL은 client별로 고정이므로 한 번만 구성 (id가 들어가는 것은 템플릿)
+        self._url_detail = self._url + "/detail"
+        self._url_execute_info = self._url + "/execute/info"
+        self._url_execute_tmpl = self._url + "/{}/execute"
+        # 이름 -> id (execute_by_name 등에서 detail 재조회 방지, 유지 시간은 client.id_cache_ttl)
+        self._id_cache = TTLCache(maxsize=256, ttl=client.id_cache_ttl)
 
     def _execute_timeout(self) -> Union[int, Tuple[int, int]]:
         """수동 실행 호출용 타임아웃. 연결 타임아웃은 클라이언트 설정을 그대로 쓴다."""
@@ -45,17 +59,87 @@ class ActionTypeNamespace:
             ActionType 상세 정보(dict)
         """
         params = {"name": name}
-        url = f"{self._url}/detail"
+        url = self._url_detail
         response = self._client._get_session().get(
             url, params=params, timeout=self._client.timeout
         )
         response.raise_for_status()
-        result = response.json()
+        result = json_codec.loads(response.content)
         self._client._check_response(result, "action type detail")
         return result.get("data", {})
 
+    def detail_many(self, names: List[str], max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 ActionType 상세를 동시에 조회 (이름 기반).
+
+        Args:
+            names: ActionType 이름 목록
+            max_workers: 동시 요청 수 상한
+
+        Returns:
+            {name: detail(name)}
+        """
+        unique = list(dict.fromkeys(names))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as executor:
+            return dict(zip(unique, executor.map(self.detail, unique)))
+
+    def _resolve_id(self, name: str, action_type_id: Optional[str]) -> str:
+        """action_type_id가 주어지면 그대로, 없으면 캐시 또는 detail(name)으로 id 조회"""
+        if action_type_id:
+            return action_type_id
+        cached = self._id_cache.get(name)
+        if cached is not MISSING:
+            return cached
+        action_type_id = self.detail(name).get("id")
+        if not action_type_id:
+            raise ValueError(f"ActionType id를 찾을 수 없습니다. name={name}")
+        self._id_cache.set(name, action_type_id)
+        return action_type_id
+
+    def _call_with_id(
+        self, name: str, action_type_id: Optional[str], call: Callable[[str], T]
+    ) -> T:
+        """
+        id를 정해 call(id) 실행.
+
+        캐시된 id로 HTTP/API 에러가 나면 캐시를 버리고 detail(name)으로 다시 조회해,
+        id가 바뀌었으면(삭제 후 재생성 등) 한 번 재시도한다. 같은 id면 원래 에러를 그대로 올린다.
+        """
+        if action_type_id:
+            return call(action_type_id)
+        cached = self._id_cache.get(name)
+        if cached is MISSING:
+            return call(self._resolve_id(name, None))
+        try:
+            return call(cached)
+        except Exception as e:
+            if isinstance(e, RequestException) and not isinstance(e, HTTPError):
+                raise  # 타임아웃/연결 실패는 id 문제가 아님
+            self._id_cache.pop(name)
+            fresh_id = self._resolve_id(name, None)
+            if fresh_id == cached:
+                raise
+        return call(fresh_id)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        이름 -> id 캐시 제거 (서버에서 ActionType을 재생성한 경우 등).
+
+        Args:
+            name: 제거할 ActionType 이름. None이면 전체 제거
+        """
+        if name is None:
+            self._id_cache.clear()
+        else:
+            self._id_cache.pop(name)
+
     def execute_by_name(
-        self, name: str, messages: List[Dict[str, Any]]
+        self,
+        name: str,
+        messages: List[Dict[str, Any]],
+        action_type_id: Optional[str] = None,
     ) -> Dict[str, Optional[Any]]:
         """
         ActionType 수동 실행 (이름 기반).
@@ -66,6 +150,8 @@ class ActionTypeNamespace:
         Args:
             name: ActionType 이름
             messages: 실행 입력 Object 목록
+            action_type_id: 이미 알고 있는 ActionType id. 주면 detail 조회를 생략한다.
+                (주지 않으면 캐시된 id를 쓰고, 그 id로 실패하면 이름으로 다시 조회해 한 번 재시도)
 
         Returns:
             {"status": bool, "run_id": str | None, "run_status": str | None, "completed": bool}
@@ -77,16 +163,18 @@ class ActionTypeNamespace:
             - `completed`: 종료 여부. false면 `run_status`가 `TIMEOUT`이다.
             - `status`: HTTP 응답 래퍼의 API 성공 플래그(실행 결과가 아님)
         """
-        action_type = self.detail(name)
-        action_type_id = action_type.get("id")
-        if not action_type_id:
-            raise ValueError(f"ActionType id를 찾을 수 없습니다. name={name}")
-        url = f"{self._url}/{action_type_id}/execute"
+        return self._call_with_id(
+            name, action_type_id, lambda resolved_id: self._execute(resolved_id, messages)
+        )
+
+    def _execute(self, action_type_id: str, messages: List[Dict[str, Any]]) -> Dict[str, Optional[Any]]:
+        """ActionType id로 수동 실행 요청"""
+        url = self._url_execute_tmpl.format(action_type_id)
         response = self._client._get_session().post(
-            url, json=messages, timeout=self._execute_timeout()
+            url, data=json_codec.dumps(messages), timeout=self._execute_timeout()
         )
         response.raise_for_status()
-        result = response.json()
+        result = json_codec.loads(response.content)
         self._client._check_response(result, "execute action type")
         return self._to_run_result(result)
 
@@ -103,12 +191,12 @@ class ActionTypeNamespace:
             `execute_by_name`과 같은 형태
             {"status": bool, "run_id": str | None, "run_status": str | None, "completed": bool}
         """
-        url = f"{self._url}/execute/info"
+        url = self._url_execute_info
         response = self._client._get_session().get(
             url, params={"run-id": run_id}, timeout=self._client.timeout
         )
         response.raise_for_status()
-        result = response.json()
+        result = json_codec.loads(response.content)
         self._client._check_response(result, "action type run status")
         return self._to_run_result(result)
 
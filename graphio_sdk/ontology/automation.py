@@ -2,11 +2,19 @@
 Automation 네임스페이스 - GraphioClient와 함께 사용
 """
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, TypeVar
+
+from requests import HTTPError, RequestException
+
+from graphio_sdk import json_codec
+from graphio_sdk.cache import MISSING, TTLCache
 
 if TYPE_CHECKING:
     from graphio_sdk.client import GraphioClient
 
+T = TypeVar("T")
+
 
 class AutomationNamespace:
     """
@@ -18,6 +26,12 @@ class AutomationNamespace:
     def __init__(self, client: "GraphioClient"):
         self._client = client
         self._url = f"{self._client.api_base}/ontology-workflow/automation"
+        # 엔드포인트 URL은 client별로 고정이므로 한 번만 구성 (id가 들어가는 것은 템플릿)
+        self._url_detail = self._url + "/detail"
+        self._url_active_tmpl = self._url + "/{}/active"
+        self._url_execute_tmpl = self._url + "/{}/execute"
+        # 이름 -> id (execute_by_name 등에서 detail 재조회 방지, 유지 시간은 client.id_cache_ttl)
+        self._id_cache = TTLCache(maxsize=256, ttl=client.id_cache_ttl)
 
     def detail(self, name: str) -> Dict[str, Any]:
         """
@@ -30,68 +44,167 @@ class AutomationNamespace:
             Automation 상세 정보(dict)
         """
         params = {"name": name}
-        url = f"{self._url}/detail"
+        url = self._url_detail
         response = self._client._get_session().get(
             url, params=params, timeout=self._client.timeout
         )
         response.raise_for_status()
-        result = response.json()
+        result = json_codec.loads(response.content)
         self._client._check_response(result, "automation detail")
         return result.get("data", {})
 
-    def set_active_by_name(self, name: str, active: bool = True) -> Dict[str, Optional[Any]]:
+    def detail_many(self, names: List[str], max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 Automation 상세를 동시에 조회 (이름 기반).
+
+        Args:
+            names: Automation 이름 목록
+            max_workers: 동시 요청 수 상한
+
+        Returns:
+            {name: detail(name)}
+        """
+        unique = list(dict.fromkeys(names))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as executor:
+            return dict(zip(unique, executor.map(self.detail, unique)))
+
+    def _resolve_id(self, name: str, automation_id: Optional[str]) -> str:
+        """automation_id가 주어지면 그대로, 없으면 캐시 또는 detail(name)으로 id 조회"""
+        if automation_id:
+            return automation_id
+        cached = self._id_cache.get(name)
+        if cached is not MISSING:
+            return cached
+        automation_id = self.detail(name).get("id")
+        if not automation_id:
+            raise ValueError(f"Automation id를 찾을 수 없습니다. name={name}")
+        self._id_cache.set(name, automation_id)
+        return automation_id
+
+    def _call_with_id(
+        self, name: str, automation_id: Optional[str], call: Callable[[str], T]
+    ) -> T:
+        """
+        id를 정해 call(id) 실행.
+
+        캐시된 id로 HTTP/API 에러가 나면 캐시를 버리고 detail(name)으로 다시 조회해,
+        id가 바뀌었으면(삭제 후 재생성 등) 한 번 재시도한다. 같은 id면 원래 에러를 그대로 올린다.
+        """
+        if automation_id:
+            return call(automation_id)
+        cached = self._id_cache.get(name)
+        if cached is MISSING:
+            return call(self._resolve_id(name, None))
+        try:
+            return call(cached)
+        except Exception as e:
+            if isinstance(e, RequestException) and not isinstance(e, HTTPError):
+                raise  # 타임아웃/연결 실패는 id 문제가 아님
+            self._id_cache.pop(name)
+            fresh_id = self._resolve_id(name, None)
+            if fresh_id == cached:
+                raise
+        return call(fresh_id)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        이름 -> id 캐시 제거 (서버에서 Automation을 재생성한 경우 등).
+
+        Args:
+            name: 제거할 Automation 이름. None이면 전체 제거
+        """
+        if name is None:
+            self._id_cache.clear()
+        else:
+            self._id_cache.pop(name)
+
+    def set_active_by_name(
+        self, name: str, active: bool = True, automation_id: Optional[str] = None
+    ) -> Dict[str, Optional[Any]]:
         """
         Automation 활성/비활성 (이름 기반).
 
         Args:
             name: Automation 이름
             active: 활성화 여부
+            automation_id: 이미 알고 있는 Automation id. 주면 detail 조회를 생략한다.
+                (주지 않으면 캐시된 id를 쓰고, 그 id로 실패하면 이름으로 다시 조회해 한 번 재시도)
 
         Returns:
             {"status": bool, "active": bool | None}
         """
-        automation = self.detail(name)
-        automation_id = automation.get("id")
-        if not automation_id:
-            raise ValueError(f"Automation id를 찾을 수 없습니다. name={name}")
-        url = f"{self._url}/{automation_id}/active"
+        return self._call_with_id(
+            name, automation_id, lambda resolved_id: self._set_active(resolved_id, active)
+        )
+
+    def _set_active(self, automation_id: str, active: bool) -> Dict[str, Optional[Any]]:
+        """Automation id로 활성/비활성 요청"""
+        url = self._url_active_tmpl.format(automation_id)
         response = self._client._get_session().post(
             url,
-            json={"active": active},
-            headers={"Content-Type": "application/json"},
+            data=json_codec.dumps({"active": active}),
             timeout=self._client.timeout,
         )
         response.raise_for_status()
-        result = response.json()
+        result = json_codec.loads(response.content)
         self._client._check_response(result, "set automation active")
         return {
             "status": result.get("status"),
             "active": result.get("data"),
         }
 
-    def execute_by_name(self, name: str) -> Dict[str, Optional[Any]]:
+    def execute_by_name(
+        self, name: str, automation_id: Optional[str] = None
+    ) -> Dict[str, Optional[Any]]:
         """
         Automation 수동 실행 (이름 기반).
 
         Args:
             name: Automation 이름
+            automation_id: 이미 알고 있는 Automation id. 주면 detail 조회를 생략한다.
+                (주지 않으면 캐시된 id를 쓰고, 그 id로 실패하면 이름으로 다시 조회해 한 번 재시도)
 
         Returns:
             {"status": bool, "execution_id": str | None}
         """
-        automation = self.detail(name)
-        automation_id = automation.get("id")
-        if not automation_id:
-            raise ValueError(f"Automation id를 찾을 수 없습니다. name={name}")
-        url = f"{self._url}/{automation_id}/execute"
+        return self._call_with_id(name, automation_id, self._execute)
+
+    def _execute(self, automation_id: str) -> Dict[str, Optional[Any]]:
+        """Automation id로 수동 실행 요청"""
+        url = self._url_execute_tmpl.format(automation_id)
         response = self._client._get_session().post(url, timeout=self._client.timeout)
         response.raise_for_status()
-        result = response.json()
+        result = json_codec.loads(response.content)
         self._client._check_response(result, "execute automation")
         return {
             "status": result.get("status"),
             "execution_id": result.get("data"),
         }
 
+    def execute_many_by_name(
+        self, names: List[str], max_workers: int = 8
+    ) -> List[Dict[str, Optional[Any]]]:
+        """
+        여러 Automation을 동시에 수동 실행 (이름 기반).
+
+        id 조회(detail)는 이름마다 한 번만 하고, 실행은 요청한 항목마다 한 번씩 합니다
+        (같은 이름을 두 번 넣으면 두 번 실행). 요청은 클라이언트 세션의 keep-alive 커넥션을 공유합니다.
+
+        Args:
+            names: Automation 이름 목록
+            max_workers: 동시 요청 수 상한
+
+        Returns:
+            names 순서대로 execute_by_name(name) 결과 리스트
+        """
+        if not names:
+            return []
+        unique = list(dict.fromkeys(names))
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as executor:
+            ids = dict(zip(unique, executor.map(lambda name: self._resolve_id(name, None), unique)))
+            return list(executor.map(lambda name: self._execute(ids[name]), names))
+
 
 __all__ = ["AutomationNamespace"]
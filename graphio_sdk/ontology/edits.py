@@ -4,30 +4,46 @@
 
 from typing import List, Dict, Any, Optional, Union
 
+from .object_type import ObjectTypeBase
+
 
 class EditableObject:
     """편집 가능한 객체"""
 
+    # 고정 필드는 슬롯에 저장. '_' 로 시작하는 그 밖의 이름은 _private dict(처음 쓸 때 생성),
+    # 그 외 속성은 모두 _properties로 (인스턴스 __dict__ 없음)
+    __slots__ = ("object_type_id", "element_id", "_properties", "_private")
+
     def __init__(
             self,
             object_type_id: str,
             properties: Dict[str, Any],
             element_id: Optional[str] = None
     ):
-        self.object_type_id = object_type_id
-        self.element_id = element_id
-        self._properties = properties if properties else {}
+        object.__setattr__(self, "object_type_id", object_type_id)
+        object.__setattr__(self, "element_id", element_id)
+        object.__setattr__(self, "_properties", properties if properties else {})
+        object.__setattr__(self, "_private", None)
 
     def __setattr__(self, name: str, value: Any):
-        if name.startswith('_') or name in ('object_type_id', 'element_id'):
-            super().__setattr__(name, value)
+        if name in _EDITABLE_SLOTS:
+            object.__setattr__(self, name, value)
+        elif name.startswith('_'):
+            private = self._private
+            if private is None:
+                private = {}
+                object.__setattr__(self, "_private", private)
+            private[name] = value
         else:
             # 속성 설정은 _properties에 저장
             self._properties[name] = value
 
     def __getattr__(self, name: str):
-        if name in self._properties:
-            return self._properties[name]
+        # 슬롯/클래스 속성에 없는 이름만 여기로 옴 (값이 없는 슬롯은 그대로 AttributeError)
+        if name not in _EDITABLE_SLOTS:
+            values = self._private if name.startswith('_') else self._properties
+            if values and name in values:
+                return values[name]
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def get_properties(self) -> Dict[str, Any]:
@@ -45,6 +61,9 @@ class EditableObject:
         return message
 
 
+_EDITABLE_SLOTS = frozenset(EditableObject.__slots__)
+
+
 class ObjectTypeEditor:
     """특정 ObjectType에 대한 편집 헬퍼"""
 
@@ -133,9 +152,11 @@ class ObjectsAccessor:
     """objects.XXX 형태로 접근하기 위한 헬퍼"""
 
     def __init__(self, edits_builder: 'OntologyEditsBuilder', object_types: Dict[str, type]):
-        self._edits_builder = edits_builder
-        self._object_types = object_types
-        self._dynamic_attributes: Dict[str, type] = {}  # 동적으로 할당된 ObjectType 클래스들
+        # 내부 속성은 __setattr__을 거치지 않고 먼저 설정
+        object.__setattr__(self, '_edits_builder', edits_builder)
+        object.__setattr__(self, '_object_types', object_types)
+        # 동적으로 할당된 ObjectType 클래스들
+        object.__setattr__(self, '_dynamic_attributes', {})
 
     def __getattr__(self, name: str) -> ObjectTypeEditor:
         # 1. 먼저 이름으로 등록된 ObjectType 찾기
@@ -150,15 +171,12 @@ class ObjectsAccessor:
 
     def __setattr__(self, name: str, value: Any):
         # 내부 속성은 일반적으로 설정
-        if name.startswith('_') or name in ('_edits_builder', '_object_types', '_dynamic_attributes'):
-            super().__setattr__(name, value)
+        if name[0] == '_':
+            object.__setattr__(self, name, value)
             return
-        
-        # ObjectType 클래스를 할당하는 경우
-        from .object_type import ObjectTypeBase
+
+        # ObjectType 클래스를 할당하는 경우 (_dynamic_attributes는 __init__에서 항상 설정됨)
         if isinstance(value, type) and issubclass(value, ObjectTypeBase):
-            if not hasattr(self, '_dynamic_attributes'):
-                self._dynamic_attributes = {}
             self._dynamic_attributes[name] = value
             return
         
@@ -180,7 +198,6 @@ class ObjectsAccessor:
             edits.objects(unit_ot).edit({...})
         """
         # ObjectTypeBase를 상속받은 클래스인지 확인
-        from .object_type import ObjectTypeBase
         if not isinstance(object_type_class, type) or not issubclass(object_type_class, ObjectTypeBase):
             raise ValueError(f"ObjectType 클래스가 아닙니다: {object_type_class}")
         
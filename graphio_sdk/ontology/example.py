@@ -2,271 +2,364 @@
 GraphIO Ontology SDK 사용 예제 (실제 데이터 조회)
 """
 
-import json
-from graphio_sdk import GraphioClient, LogicalCondition
+import asyncio
+import functools
+import io
+import os
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from graphio_sdk import GraphioClient, LogicalCondition, json_codec
 
 client = GraphioClient()
 
+# GRAPHIO_TB=1 이면 예제 에러 시 전체 스택 트레이스도 출력
+_PRINT_TRACEBACK = bool(os.getenv("GRAPHIO_TB"))
 
+# 예제 실행 중인 스레드별 출력 버퍼
+_output = threading.local()
+
+
+def _print(*values):
+    """예제 출력 - 버퍼가 열려 있으면 모아 두고, 아니면 바로 stdout에 쓴다"""
+    text = " ".join(map(str, values)) + "\n"
+    buf = getattr(_output, "buf", None)
+    if buf is None:
+        sys.stdout.write(text)
+    else:
+        buf.write(text)
+
+
+# 결과 행 출력 템플릿 (format_map용, 없는 필드는 None으로 출력)
+_ROW_NAME_AGE_EMAIL = "  - {name}: {age}세, {email}"
+_ROW_NAME_AGE_DEPT = "{name} - {age}세 - {department}"
+_ROW_NAME_DEPT = "  - {name} ({department})"
+_ROW_TICKET = "  - #{ticket_id}: {title} [{priority}]"
+_ROW_XY = "x={x}, y={y}"
+
+
+class _Row:
+    """format_map용 행 래퍼 - 없는 키는 row.get()처럼 None"""
+    __slots__ = ("_row",)
+
+    def __init__(self, row: dict):
+        self._row = row
+
+    def __getitem__(self, key):
+        return self._row.get(key)
+
+
+def _print_rows(template: str, rows, numbered: bool = False):
+    """행 목록을 템플릿으로 포맷해 한 번에 출력 (numbered=True면 '  1. ' 번호 붙임)"""
+    if not rows:
+        return
+    if numbered:
+        lines = [f"  {i}. " + template.format_map(_Row(row)) for i, row in enumerate(rows, 1)]
+    else:
+        lines = [template.format_map(_Row(row)) for row in rows]
+    _print("\n".join(lines))
+
+
+def _buffered(example):
+    """예제 하나의 출력을 모았다가 끝날 때 sys.stdout.write 한 번으로 내보낸다"""
+    @functools.wraps(example)
+    def wrapper(*args, **kwargs):
+        if getattr(_output, "buf", None) is not None:
+            return example(*args, **kwargs)
+        _output.buf = io.StringIO()
+        try:
+            return example(*args, **kwargs)
+        finally:
+            buf, _output.buf = _output.buf, None
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+def _report(e: Exception):
+    """예제 공통 에러 출력 (기본은 한 줄, GRAPHIO_TB 설정 시 스택 트레이스 포함)"""
+    _print(f"✗ 에러: {e}")
+    if _PRINT_TRACEBACK:
+        # stderr로 바로 쓰지 않고 같은 버퍼로 보내 예제 출력 순서를 유지
+        _print(traceback.format_exc().rstrip("\n"))
+
+
+@_buffered
 def example_basic_data_query():
     """예제 1: 기본 데이터 조회"""
-    print("\n" + "=" * 80)
-    print("예제 1: 기본 데이터 조회")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 1: 기본 데이터 조회")
+    _print("=" * 80)
 
     try:
         # 한글 ObjectType 이름도 지원
         alarm_zone = client.ontology.get_object_type("유닛")
 
         if not alarm_zone:
-            print("✗ '유닛' ObjectType을 찾을 수 없습니다.")
+            _print("✗ '유닛' ObjectType을 찾을 수 없습니다.")
             return
 
-        print(f"✓ '유닛' ObjectType 로드 완료")
-        print(f"  - ObjectType ID: {alarm_zone._object_type_id}")
-        print(f"  - Properties: {alarm_zone._properties}")
+        _print(f"✓ '유닛' ObjectType 로드 완료")
+        _print(f"  - ObjectType ID: {alarm_zone._object_type_id}")
+        _print(f"  - Properties: {alarm_zone._properties}")
 
         # 실제 데이터 조회 - select('*')로 모든 필드 선택
-        print("\n[실제 데이터 조회 - 모든 필드]")
+        _print("\n[실제 데이터 조회 - 모든 필드]")
         results = (alarm_zone
                    .where(alarm_zone.x > 650)
                    .select('*')
                    .limit(10)
                    .execute())
 
-        print(f"✓ 조회 완료: {len(results)}건")
-        print(f"\n결과:")
+        _print(f"✓ 조회 완료: {len(results)}건")
+        _print(f"\n결과:")
         for i, result in enumerate(results, 1):
-            print(f"  {i}. {result}")
+            _print(f"  {i}. {result}")
 
         if results:
-            print(f"\n첫 번째 레코드 전체:")
-            print(json.dumps(results[0], indent=2, ensure_ascii=False))
+            _print(f"\n첫 번째 레코드 전체:")
+            _print(json_codec.dumps_pretty(results[0]))
 
     except Exception as e:
-        print(f"✗ 에러: {e}")
-        import traceback
-        traceback.print_exc()
+        _report(e)
 
 
+@_buffered
 def example_select_all_fields():
     """예제 2: 모든 필드 선택 (select('*'))"""
-    print("\n" + "=" * 80)
-    print("예제 2: 모든 필드 선택")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 2: 모든 필드 선택")
+    _print("=" * 80)
 
     try:
         Employee = client.ontology.get_object_type("Employee")
 
         if not Employee:
-            print("✗ Employee ObjectType을 찾을 수 없습니다.")
+            _print("✗ Employee ObjectType을 찾을 수 없습니다.")
             return
 
         # select('*')로 모든 필드 선택
-        print("[1] 모든 필드 선택")
+        _print("[1] 모든 필드 선택")
         all_fields = (Employee
                       .where(Employee.age > 30)
                       .select('*')
                       .limit(5)
                       .execute())
 
-        print(f"✓ {len(all_fields)}건 조회")
+        _print(f"✓ {len(all_fields)}건 조회")
         if all_fields:
-            print(f"  필드 목록: {list(all_fields[0].keys())}")
-            print(f"\n  첫 번째 레코드:")
-            print(json.dumps(all_fields[0], indent=2, ensure_ascii=False))
+            _print(f"  필드 목록: {', '.join(all_fields[0])}")
+            _print(f"\n  첫 번째 레코드:")
+            _print(json_codec.dumps_pretty(all_fields[0]))
 
         # 특정 필드만 선택
-        print("\n[2] 특정 필드만 선택")
+        _print("\n[2] 특정 필드만 선택")
         specific_fields = (Employee
                            .where(Employee.age > 30)
                            .select("name", "age", "email")
                            .limit(5)
                            .execute())
 
-        print(f"✓ {len(specific_fields)}건 조회")
-        for emp in specific_fields:
-            print(f"  - {emp.get('name')}: {emp.get('age')}세, {emp.get('email')}")
+        _print(f"✓ {len(specific_fields)}건 조회")
+        _print_rows(_ROW_NAME_AGE_EMAIL, specific_fields)
 
     except Exception as e:
-        print(f"✗ 에러: {e}")
-        import traceback
-        traceback.print_exc()
+        _report(e)
+
 
+# 예제 3 조건 트리 캐시 - ObjectType id별 (Condition은 불변이라 재사용해도 안전)
+# 클래스가 아니라 id를 키로 둬서 clear_cache 후 다시 로드한 클래스도 같은 트리를 쓰고, 옛 클래스를 붙잡지 않음
+_complex_conditions_by_type_id: dict = {}
 
+
+def _complex_query_conditions(Employee) -> dict:
+    """예제 3의 조건 트리 (ObjectType id별로 한 번만 구성)"""
+    conditions = _complex_conditions_by_type_id.get(Employee._object_type_id)
+    if conditions is None:
+        conditions = _complex_conditions_by_type_id.setdefault(
+            Employee._object_type_id, _build_complex_query_conditions(Employee)
+        )
+    return conditions
+
+
+def _build_complex_query_conditions(Employee) -> dict:
+    return {
+        "and": LogicalCondition("and", [
+            Employee.age > 30,
+            Employee.department == "Engineering"
+        ]),
+        "or": LogicalCondition("or", [
+            Employee.age < 25,
+            Employee.age > 50
+        ]),
+        "nested": LogicalCondition("and", [
+            LogicalCondition("or", [
+                Employee.age > 40,
+                Employee.department == "Sales"
+            ]),
+            Employee.active == True
+        ]),
+        "like": Employee.name.like("John%"),
+        "in": Employee.department.is_in(["Sales", "Marketing", "HR"]),
+    }
+
+
+@_buffered
 def example_complex_queries():
     """예제 3: 복잡한 쿼리"""
-    print("\n" + "=" * 80)
-    print("예제 3: 복잡한 쿼리")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 3: 복잡한 쿼리")
+    _print("=" * 80)
 
     try:
         Employee = client.ontology.get_object_type("Employee")
 
         if not Employee:
-            print("✗ Employee ObjectType을 찾을 수 없습니다.")
+            _print("✗ Employee ObjectType을 찾을 수 없습니다.")
             return
 
+        conditions = _complex_query_conditions(Employee)
+
         # 1. AND 조건
-        print("[1] AND 조건: age > 30 AND department = 'Engineering'")
+        _print("[1] AND 조건: age > 30 AND department = 'Engineering'")
         result = (Employee
-                  .where(
-            LogicalCondition("and", [
-                Employee.age > 30,
-                Employee.department == "Engineering"
-            ])
-        )
+                  .where(conditions["and"])
                   .select("name", "age", "department")
                   .limit(5)
-                  .execute())
+                  .execute_columnar())
 
-        print(f"✓ {len(result)}건 조회")
-        for emp in result:
-            print(f"  - {emp.get('name')}: {emp.get('age')}세, {emp.get('department')}")
+        _print(f"✓ {len(result['name'])}건 조회")
+        for name, age, department in zip(result["name"], result["age"], result["department"]):
+            _print(f"  - {name}: {age}세, {department}")
 
         # 2. OR 조건
-        print("\n[2] OR 조건: age < 25 OR age > 50")
+        _print("\n[2] OR 조건: age < 25 OR age > 50")
         result = (Employee
-                  .where(
-            LogicalCondition("or", [
-                Employee.age < 25,
-                Employee.age > 50
-            ])
-        )
+                  .where(conditions["or"])
                   .select("name", "age")
                   .limit(5)
-                  .execute())
+                  .execute_columnar())
 
-        print(f"✓ {len(result)}건 조회")
-        for emp in result:
-            print(f"  - {emp.get('name')}: {emp.get('age')}세")
+        _print(f"✓ {len(result['name'])}건 조회")
+        for name, age in zip(result["name"], result["age"]):
+            _print(f"  - {name}: {age}세")
 
         # 3. 중첩 조건
-        print("\n[3] 중첩 조건: (age > 40 OR department = 'Sales') AND active = true")
+        _print("\n[3] 중첩 조건: (age > 40 OR department = 'Sales') AND active = true")
         result = (Employee
-                  .where(
-            LogicalCondition("and", [
-                LogicalCondition("or", [
-                    Employee.age > 40,
-                    Employee.department == "Sales"
-                ]),
-                Employee.active == True
-            ])
-        )
+                  .where(conditions["nested"])
                   .select("name", "age", "department", "active")
                   .limit(5)
-                  .execute())
+                  .execute_columnar())
 
-        print(f"✓ {len(result)}건 조회")
-        for emp in result:
-            print(f"  - {emp.get('name')}: {emp.get('age')}세, {emp.get('department')}, Active: {emp.get('active')}")
+        _print(f"✓ {len(result['name'])}건 조회")
+        for name, age, department, active in zip(
+                result["name"], result["age"], result["department"], result["active"]):
+            _print(f"  - {name}: {age}세, {department}, Active: {active}")
 
         # 4. LIKE 검색
-        print("\n[4] LIKE 검색: name LIKE 'John%'")
+        _print("\n[4] LIKE 검색: name LIKE 'John%'")
         result = (Employee
-                  .where(Employee.name.like("John%"))
+                  .where(conditions["like"])
                   .select("name", "email")
                   .limit(5)
-                  .execute())
+                  .execute_columnar())
 
-        print(f"✓ {len(result)}건 조회")
-        for emp in result:
-            print(f"  - {emp.get('name')}: {emp.get('email')}")
+        _print(f"✓ {len(result['name'])}건 조회")
+        for name, email in zip(result["name"], result["email"]):
+            _print(f"  - {name}: {email}")
 
         # 5. IN 조건
-        print("\n[5] IN 조건: department IN ['Sales', 'Marketing', 'HR']")
+        _print("\n[5] IN 조건: department IN ['Sales', 'Marketing', 'HR']")
         result = (Employee
-                  .where(Employee.department.is_in(["Sales", "Marketing", "HR"]))
+                  .where(conditions["in"])
                   .select("name", "department")
                   .limit(5)
-                  .execute())
+                  .execute_columnar())
 
-        print(f"✓ {len(result)}건 조회")
-        for emp in result:
-            print(f"  - {emp.get('name')}: {emp.get('department')}")
+        _print(f"✓ {len(result['name'])}건 조회")
+        for name, department in zip(result["name"], result["department"]):
+            _print(f"  - {name}: {department}")
 
     except Exception as e:
-        print(f"✗ 에러: {e}")
-        import traceback
-        traceback.print_exc()
+        _report(e)
 
 
+@_buffered
 def example_utility_methods():
     """예제 4: 유틸리티 메서드 (count, first, exists)"""
-    print("\n" + "=" * 80)
-    print("예제 4: 유틸리티 메서드")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 4: 유틸리티 메서드")
+    _print("=" * 80)
 
     try:
         Employee = client.ontology.get_object_type("Employee")
 
         if not Employee:
-            print("✗ Employee ObjectType을 찾을 수 없습니다.")
+            _print("✗ Employee ObjectType을 찾을 수 없습니다.")
             return
 
         # 1. count() - 개수 세기
-        print("[1] count(): 30세 이상 직원 수")
+        _print("[1] count(): 30세 이상 직원 수")
         count = (Employee
                  .where(Employee.age >= 30)
-                 .select("name")  # 필드는 필요하지만 count만 반환
-                 .count())
-        print(f"✓ 30세 이상 직원: {count}명")
+                 .count())  # select() 없이 필드 하나만 조회
+        _print(f"✓ 30세 이상 직원: {count}명")
 
         # 2. first() - 첫 번째 레코드
-        print("\n[2] first(): 첫 번째 직원")
+        _print("\n[2] first(): 첫 번째 직원")
         first_emp = (Employee
                      .where(Employee.age > 0)
                      .select("name", "age", "department")
                      .first())
 
         if first_emp:
-            print(f"✓ {first_emp.get('name')}: {first_emp.get('age')}세, {first_emp.get('department')}")
+            _print(f"✓ {first_emp.get('name')}: {first_emp.get('age')}세, {first_emp.get('department')}")
         else:
-            print("✗ 데이터 없음")
+            _print("✗ 데이터 없음")
 
         # 3. exists() - 존재 여부 확인
-        print("\n[3] exists(): Engineering 부서 직원 존재 여부")
+        _print("\n[3] exists(): Engineering 부서 직원 존재 여부")
         has_engineers = (Employee
                          .where(Employee.department == "Engineering")
-                         .select("name")
                          .exists())
-        print(f"✓ Engineering 부서 직원 {'존재함' if has_engineers else '없음'}")
+        _print(f"✓ Engineering 부서 직원 {'존재함' if has_engineers else '없음'}")
 
         # 4. limit과 함께 사용
-        print("\n[4] limit(): 상위 3명만 조회")
+        _print("\n[4] limit(): 상위 3명만 조회")
         top_3 = (Employee
                  .select("name", "age", "email")
                  .limit(3)
-                 .execute())
+                 .execute_columnar())
 
-        print(f"✓ {len(top_3)}건 조회")
-        for i, emp in enumerate(top_3, 1):
-            print(f"  {i}. {emp.get('name')}")
+        _print(f"✓ {len(top_3['name'])}건 조회")
+        for i, name in enumerate(top_3["name"], 1):
+            _print(f"  {i}. {name}")
 
     except Exception as e:
-        print(f"✗ 에러: {e}")
-        import traceback
-        traceback.print_exc()
+        _report(e)
 
 
+@_buffered
 def example_pagination():
     """예제 5: 페이지네이션 구현"""
-    print("\n" + "=" * 80)
-    print("예제 5: 페이지네이션")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 5: 페이지네이션")
+    _print("=" * 80)
 
     try:
         Employee = client.ontology.get_object_type("Employee")
 
         if not Employee:
-            print("✗ Employee ObjectType을 찾을 수 없습니다.")
+            _print("✗ Employee ObjectType을 찾을 수 없습니다.")
             return
 
         page_size = 5
         page = 1
 
-        print(f"페이지 크기: {page_size}개")
-        print(f"\n[페이지 {page}]")
+        _print(f"페이지 크기: {page_size}개")
+        _print(f"\n[페이지 {page}]")
 
         # 첫 페이지
         employees = (Employee
@@ -274,88 +367,95 @@ def example_pagination():
                      .limit(page_size)
                      .execute())
 
-        print(f"✓ {len(employees)}건 조회")
-        for i, emp in enumerate(employees, 1):
-            print(f"  {i}. {emp.get('name')} - {emp.get('age')}세 - {emp.get('department')}")
+        _print(f"✓ {len(employees)}건 조회")
+        _print_rows(_ROW_NAME_AGE_DEPT, employees, numbered=True)
 
         # Note: 실제 페이지네이션을 위해서는 offset이 필요하지만
         # 현재 API가 offset을 지원하지 않으므로 limit만 사용
-        print("\n* 참고: offset 파라미터가 추가되면 완전한 페이지네이션 구현 가능")
+        _print("\n* 참고: offset 파라미터가 추가되면 완전한 페이지네이션 구현 가능")
 
     except Exception as e:
-        print(f"✗ 에러: {e}")
-        import traceback
-        traceback.print_exc()
+        _report(e)
 
 
+@_buffered
 def example_multiple_object_types():
     """예제 6: 여러 ObjectType 동시 사용"""
-    print("\n" + "=" * 80)
-    print("예제 6: 여러 ObjectType 동시 사용")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 6: 여러 ObjectType 동시 사용")
+    _print("=" * 80)
 
     try:
-        # 여러 ObjectType 로드
-        Employee = client.ontology.get_object_type("Employee")
-        Ticket = client.ontology.get_object_type("Ticket")
-
-        if Employee:
-            print("[Employee 데이터]")
-            employees = (Employee
-                         .select("name", "department")
-                         .limit(3)
-                         .execute())
-            print(f"✓ {len(employees)}건 조회")
-            for emp in employees:
-                print(f"  - {emp.get('name')} ({emp.get('department')})")
-
-        if Ticket:
-            print("\n[Ticket 데이터]")
-            tickets = (Ticket
-                       .where(Ticket.status == "open")
-                       .select("ticket_id", "title", "priority")
-                       .limit(3)
-                       .execute())
-            print(f"✓ {len(tickets)}건 조회")
-            for ticket in tickets:
-                print(f"  - #{ticket.get('ticket_id')}: {ticket.get('title')} [{ticket.get('priority')}]")
+        # 서로 독립적인 로드/조회이므로 동시에 실행 (소요 시간 ≈ 느린 쪽 하나)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fut_employee = executor.submit(client.ontology.get_object_type, "Employee")
+            fut_ticket = executor.submit(client.ontology.get_object_type, "Ticket")
+            Employee, Ticket = fut_employee.result(), fut_ticket.result()
 
-        print(f"\n캐시된 ObjectType: {client.ontology.list_object_types()}")
+            fut_employees = fut_tickets = None
+            if Employee:
+                fut_employees = executor.submit(
+                    Employee
+                    .select("name", "department")
+                    .limit(3)
+                    .execute
+                )
+            if Ticket:
+                fut_tickets = executor.submit(
+                    Ticket
+                    .where(Ticket.status == "open")
+                    .select("ticket_id", "title", "priority")
+                    .limit(3)
+                    .execute
+                )
+
+        if fut_employees is not None:
+            _print("[Employee 데이터]")
+            employees = fut_employees.result()
+            _print(f"✓ {len(employees)}건 조회")
+            _print_rows(_ROW_NAME_DEPT, employees)
+
+        if fut_tickets is not None:
+            _print("\n[Ticket 데이터]")
+            tickets = fut_tickets.result()
+            _print(f"✓ {len(tickets)}건 조회")
+            _print_rows(_ROW_TICKET, tickets)
+
+        _print(f"\n캐시된 ObjectType: {client.ontology.list_object_types()}")
 
     except Exception as e:
-        print(f"✗ 에러: {e}")
-        import traceback
-        traceback.print_exc()
+        _report(e)
 
 
+@_buffered
 def example_error_handling():
     """예제 7: 에러 처리"""
-    print("\n" + "=" * 80)
-    print("예제 7: 에러 처리")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 7: 에러 처리")
+    _print("=" * 80)
 
     try:
         # 1. 존재하지 않는 ObjectType
-        print("[1] 존재하지 않는 ObjectType")
+        _print("[1] 존재하지 않는 ObjectType")
         NonExistent = client.ontology.get_object_type("NonExistentType")
 
         if NonExistent:
-            print("✓ ObjectType 로드 성공")
+            _print("✓ ObjectType 로드 성공")
         else:
-            print("✗ ObjectType을 찾을 수 없습니다 (정상 동작)")
+            _print("✗ ObjectType을 찾을 수 없습니다 (정상 동작)")
 
         # 2. select 없이 실행
-        print("\n[2] select 없이 execute() 호출")
+        _print("\n[2] select 없이 execute() 호출")
         try:
             Employee = client.ontology.get_object_type("Employee")
 
             if Employee:
                 result = Employee.where(Employee.age > 30).execute()
         except ValueError as e:
-            print(f"✗ 예상된 에러: {e}")
+            _print(f"✗ 예상된 에러: {e}")
 
         # 3. 잘못된 필드 조회는 서버에서 처리
-        print("\n[3] 존재하지 않는 필드 조회")
+        _print("\n[3] 존재하지 않는 필드 조회")
         try:
             Employee = client.ontology.get_object_type("Employee")
 
@@ -364,48 +464,46 @@ def example_error_handling():
                           .select("name", "nonexistent_field")
                           .limit(1)
                           .execute())
-                print(f"✓ 조회 완료: {len(result)}건 (서버가 처리)")
+                _print(f"✓ 조회 완료: {len(result)}건 (서버가 처리)")
         except Exception as e:
-            print(f"✗ 서버 에러: {e}")
+            _print(f"✗ 서버 에러: {e}")
 
     except Exception as e:
-        print(f"✗ 에러: {e}")
-        import traceback
-        traceback.print_exc()
+        _report(e)
 
 
+@_buffered
 def example_korean_object_types():
     """예제 8: 한글 ObjectType 이름 사용"""
-    print("\n" + "=" * 80)
-    print("예제 8: 한글 ObjectType 이름 사용")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 8: 한글 ObjectType 이름 사용")
+    _print("=" * 80)
 
     try:
         # 한글 ObjectType 이름으로 로드
         unit = client.ontology.get_object_type("유닛")
 
         if not unit:
-            print("✗ '유닛' ObjectType을 찾을 수 없습니다.")
+            _print("✗ '유닛' ObjectType을 찾을 수 없습니다.")
             return
 
-        print(f"✓ '유닛' ObjectType 로드 완료")
-        print(f"  - ObjectType ID: {unit._object_type_id}")
-        print(f"  - Properties: {unit._properties}")
+        _print(f"✓ '유닛' ObjectType 로드 완료")
+        _print(f"  - ObjectType ID: {unit._object_type_id}")
+        _print(f"  - Properties: {unit._properties}")
 
         # 모든 필드 선택
-        print("\n[모든 필드 조회]")
+        _print("\n[모든 필드 조회]")
         results = (unit
                    .where(unit.x > 650)
                    .select('*')
                    .limit(5)
                    .execute())
 
-        print(f"✓ {len(results)}건 조회")
-        for i, result in enumerate(results, 1):
-            print(f"  {i}. x={result.get('x')}, y={result.get('y')}")
+        _print(f"✓ {len(results)}건 조회")
+        _print_rows(_ROW_XY, results, numbered=True)
 
         # 특정 필드만 선택
-        print("\n[특정 필드만 조회]")
+        _print("\n[특정 필드만 조회]")
         if 'x' in unit._properties and 'y' in unit._properties:
             results = (unit
                        .where(unit.x > 650)
@@ -413,111 +511,133 @@ def example_korean_object_types():
                        .limit(5)
                        .execute())
 
-            print(f"✓ {len(results)}건 조회")
-            for i, result in enumerate(results, 1):
-                print(f"  {i}. x={result.get('x')}, y={result.get('y')}")
+            _print(f"✓ {len(results)}건 조회")
+            _print_rows(_ROW_XY, results, numbered=True)
 
     except Exception as e:
-        print(f"✗ 에러: {e}")
-        import traceback
-        traceback.print_exc()
+        _report(e)
 
 
+@_buffered
 def example_action_type_detail():
     """예제 9: ActionType 상세 조회 (이름 기반)"""
-    print("\n" + "=" * 80)
-    print("예제 9: ActionType 상세 조회")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 9: ActionType 상세 조회")
+    _print("=" * 80)
 
     action_type_name = "action_is_action_isnot_action"
 
     try:
         detail = client.action_type.detail(action_type_name)
-        print(f"✓ 조회 성공: {action_type_name}")
-        print(f"  - id: {detail.get('id')}")
-        print(f"  - name: {detail.get('name')}")
-        print(f"  - rules 수: {len(detail.get('rules', []))}")
+        _print(f"✓ 조회 성공: {action_type_name}")
+        _print(f"  - id: {detail.get('id')}")
+        _print(f"  - name: {detail.get('name')}")
+        _print(f"  - rules 수: {len(detail.get('rules', []))}")
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
 
 
+@_buffered
 def example_action_type_execute_by_name():
     """예제 10: ActionType 수동 실행 (이름 기반)"""
-    print("\n" + "=" * 80)
-    print("예제 10: ActionType 수동 실행")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 10: ActionType 수동 실행")
+    _print("=" * 80)
 
     action_type_name = "action_is_action_isnot_action"
 
     try:
         result = client.action_type.execute_by_name(name=action_type_name)
-        print(f"✓ 실행 요청 완료: {action_type_name}")
-        print(f"  - run_id: {result.get('run_id')}")
-        print(f"  - run_status: {result.get('run_status')}")  # SUCCESS/FAILED/PARTIAL_FAILED/TIMEOUT
-        print(f"  - completed: {result.get('completed')}")
+        _print(f"✓ 실행 요청 완료: {action_type_name}")
+        _print(f"  - run_id: {result.get('run_id')}")
+        _print(f"  - run_status: {result.get('run_status')}")  # SUCCESS/FAILED/PARTIAL_FAILED/TIMEOUT
+        _print(f"  - completed: {result.get('completed')}")
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
 
 
+@_buffered
 def example_automation_detail():
     """예제 11: Automation 상세 조회 (이름 기반)"""
-    print("\n" + "=" * 80)
-    print("예제 11: Automation 상세 조회")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 11: Automation 상세 조회")
+    _print("=" * 80)
 
     automation_name = "automation_manual_test_2602252"
 
     try:
         detail = client.automation.detail(automation_name)
-        print(f"✓ 조회 성공: {automation_name}")
-        print(f"  - id: {detail.get('id')}")
-        print(f"  - name: {detail.get('name')}")
+        _print(f"✓ 조회 성공: {automation_name}")
+        _print(f"  - id: {detail.get('id')}")
+        _print(f"  - name: {detail.get('name')}")
         action_groups = detail.get("actionGroups", {})
         nodes = action_groups.get("nodes", []) if isinstance(action_groups, dict) else []
-        print(f"  - action node 수: {len(nodes)}")
+        _print(f"  - action node 수: {len(nodes)}")
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
 
 
+@_buffered
 def example_automation_set_active_by_name():
     """예제 12: Automation 활성화 (이름 기반)"""
-    print("\n" + "=" * 80)
-    print("예제 12: Automation 활성화")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 12: Automation 활성화")
+    _print("=" * 80)
 
     automation_name = "automation_manual_test_2602252"
 
     try:
         result = client.automation.set_active_by_name(automation_name, active=True)
-        print(f"✓ 활성화 성공: {automation_name}")
-        print(f"  - status: {result.get('status')}")
-        print(f"  - active: {result.get('active')}")
+        _print(f"✓ 활성화 성공: {automation_name}")
+        _print(f"  - status: {result.get('status')}")
+        _print(f"  - active: {result.get('active')}")
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
 
 
+@_buffered
 def example_automation_execute_by_name():
     """예제 13: Automation 실행 (이름 기반)"""
-    print("\n" + "=" * 80)
-    print("예제 13: Automation 실행")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 13: Automation 실행")
+    _print("=" * 80)
 
     automation_name = "automation_manual_test_2602252"
 
     try:
         result = client.automation.execute_by_name(name=automation_name)
-        print(f"✓ 실행 성공: {automation_name}")
-        print(f"  - status: {result.get('status')}")
-        print(f"  - execution_id: {result.get('execution_id')}")
+        _print(f"✓ 실행 성공: {automation_name}")
+        _print(f"  - status: {result.get('status')}")
+        _print(f"  - execution_id: {result.get('execution_id')}")
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
+
+
+@_buffered
+def example_automation_execute_many_by_name():
+    """예제 21: 여러 Automation 동시 실행 (이름 기반)"""
+    _print("\n" + "=" * 80)
+    _print("예제 21: 여러 Automation 동시 실행")
+    _print("=" * 80)
 
+    automation_names = ["automation_manual_test_2602252"]
 
+    try:
+        results = client.automation.execute_many_by_name(automation_names)
+        for name, result in zip(automation_names, results):
+            _print(f"✓ 실행 성공: {name}")
+            _print(f"  - status: {result.get('status')}")
+            _print(f"  - execution_id: {result.get('execution_id')}")
+    except Exception as e:
+        _report(e)
+
+
+@_buffered
 def example_object_insert_batch():
     """예제 14: Object INSERT (batch, insert 사용)"""
-    print("\n" + "=" * 80)
-    print("예제 14: Object INSERT (batch)")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 14: Object INSERT (batch)")
+    _print("=" * 80)
 
     object_type_name = "사원"
 
@@ -542,17 +662,18 @@ def example_object_insert_batch():
                 {"elementId": "", "properties": obj2},
             ],
         )
-        print("✓ INSERT 실행 성공")
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        _print("✓ INSERT 실행 성공")
+        _print(json_codec.dumps_pretty(result))
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
 
 
+@_buffered
 def example_object_update_batch():
     """예제 15: Object UPDATE (batch, update 사용)"""
-    print("\n" + "=" * 80)
-    print("예제 15: Object UPDATE (batch)")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 15: Object UPDATE (batch)")
+    _print("=" * 80)
 
     object_type_name = "사원"
 
@@ -579,17 +700,18 @@ def example_object_update_batch():
             ],
             element_id_lookup_field="사원명"
         )
-        print("✓ UPDATE 실행 성공")
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        _print("✓ UPDATE 실행 성공")
+        _print(json_codec.dumps_pretty(result))
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
 
 
+@_buffered
 def example_object_delete_batch():
     """예제 16: Object DELETE (batch, delete 사용)"""
-    print("\n" + "=" * 80)
-    print("예제 16: Object DELETE (batch)")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 16: Object DELETE (batch)")
+    _print("=" * 80)
 
     object_type_name = "사원"
 
@@ -608,17 +730,18 @@ def example_object_delete_batch():
             ],
             element_id_lookup_field="id"
         )
-        print("✓ DELETE 실행 성공")
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        _print("✓ DELETE 실행 성공")
+        _print(json_codec.dumps_pretty(result))
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
 
 
+@_buffered
 def example_object_delete_edits():
     """예제 19: Object DELETE (edits 사용)"""
-    print("\n" + "=" * 80)
-    print("예제 19: Object DELETE (edits)")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("예제 19: Object DELETE (edits)")
+    _print("=" * 80)
 
     object_type_name = "사원"
     target_id = "9f3a0c2b-7c4f-4c66-b3b8-0b2e9a6e4f1d"
@@ -627,7 +750,7 @@ def example_object_delete_edits():
         Employee = client.ontology.get_object_type(object_type_name)
 
         if not Employee:
-            print(f"✗ '{object_type_name}' ObjectType을 찾을 수 없습니다.")
+            _print(f"✗ '{object_type_name}' ObjectType을 찾을 수 없습니다.")
             return
 
         employees = (Employee
@@ -636,10 +759,10 @@ def example_object_delete_edits():
                      .execute())
 
         if not employees:
-            print(f"✗ 삭제 대상을 찾을 수 없습니다. id={target_id}")
+            _print(f"✗ 삭제 대상을 찾을 수 없습니다. id={target_id}")
             return
 
-        print(f"✓ 삭제 대상 {len(employees)}건 조회")
+        _print(f"✓ 삭제 대상 {len(employees)}건 조회")
 
         edits = client.ontology.edits()
 
@@ -649,70 +772,119 @@ def example_object_delete_edits():
                 "elementId": employee["elementId"],
                 "properties": {"id": props["id"]},
             })
-            print(f"  - 삭제 예약: {props.get('사원명')} (id={props.get('id')})")
+            _print(f"  - 삭제 예약: {props.get('사원명')} (id={props.get('id')})")
 
         result = edits.commit()
-        print("✓ DELETE 실행 성공")
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        _print("✓ DELETE 실행 성공")
+        _print(json_codec.dumps_pretty(result))
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
+
+
+KG_OBJECT_TYPE_NAME = "용역계약업체"
+KG_HOP = 1
+KG_OBJECT_TYPE_ID_LIST = [
+    "e82c5c6d-dbdf-47fc-b5fd-744f1b9d6d17",
+    "ee58e6c0-3786-48d0-97c4-366b0fc87ece",
+]
+KG_LINK_TYPE_ID_LIST = [
+    "1f3a72cd-60fe-40b9-b02e-1c49d052d103",
+]
 
 
-def example_knowledge_graph_by_object_type_name():
-    """예제 17: KnowledgeGraph 조회 (ObjectType 이름 + hop)"""
-    print("\n" + "=" * 80)
-    print("예제 17: KnowledgeGraph 조회 (ObjectType 이름 + hop)")
-    print("=" * 80)
+@_buffered
+def example_knowledge_graph_by_object_type_name(graph=None):
+    """예제 17: KnowledgeGraph 조회 (ObjectType 이름 + hop)
 
-    object_type_name = "용역계약업체"
-    hop = 1
+    graph를 넘기면 (예: example_knowledge_graph_batch에서 미리 조회한 결과) 조회 없이 출력만 합니다.
+    """
+    _print("\n" + "=" * 80)
+    _print("예제 17: KnowledgeGraph 조회 (ObjectType 이름 + hop)")
+    _print("=" * 80)
+
+    object_type_name = KG_OBJECT_TYPE_NAME
+    hop = KG_HOP
 
     try:
-        graph = client.knowledge_graph.graph_by_object_type_name(object_type_name, hop=hop)
+        if graph is None:
+            graph = client.knowledge_graph.graph_by_object_type_name(object_type_name, hop=hop)
         nodes = graph.get("nodes", [])
         edges = graph.get("edges", [])
-        print(f"✓ 조회 성공: object_type_name={object_type_name}, hop={hop}")
-        print(f"  - nodes: {len(nodes)}")
-        print(f"  - edges: {len(edges)}")
+        _print(f"✓ 조회 성공: object_type_name={object_type_name}, hop={hop}")
+        _print(f"  - nodes: {len(nodes)}")
+        _print(f"  - edges: {len(edges)}")
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
+
 
+@_buffered
+def example_knowledge_graph_by_object_and_link_types(graph=None):
+    """예제 18: KnowledgeGraph 조회 (ObjectType list + LinkType list)
 
-def example_knowledge_graph_by_object_and_link_types():
-    """예제 18: KnowledgeGraph 조회 (ObjectType list + LinkType list)"""
-    print("\n" + "=" * 80)
-    print("예제 18: KnowledgeGraph 조회 (ObjectType list + LinkType list)")
-    print("=" * 80)
+    graph를 넘기면 (예: example_knowledge_graph_batch에서 미리 조회한 결과) 조회 없이 출력만 합니다.
+    """
+    _print("\n" + "=" * 80)
+    _print("예제 18: KnowledgeGraph 조회 (ObjectType list + LinkType list)")
+    _print("=" * 80)
 
-    object_type_id_list = [
-        "e82c5c6d-dbdf-47fc-b5fd-744f1b9d6d17",
-        "ee58e6c0-3786-48d0-97c4-366b0fc87ece",
-    ]
-    link_type_id_list = [
-        "1f3a72cd-60fe-40b9-b02e-1c49d052d103",
-    ]
+    object_type_id_list = KG_OBJECT_TYPE_ID_LIST
+    link_type_id_list = KG_LINK_TYPE_ID_LIST
 
     try:
-        # element_id_list는 전달하지 않으면 자동으로 []가 사용됩니다.
-        graph = client.knowledge_graph.graph_by_object_and_link_types(
-            object_type_id_list=object_type_id_list,
-            link_type_id_list=link_type_id_list,
-        )
+        if graph is None:
+            # element_id_list는 전달하지 않으면 자동으로 []가 사용됩니다.
+            graph = client.knowledge_graph.graph_by_object_and_link_types(
+                object_type_id_list=object_type_id_list,
+                link_type_id_list=link_type_id_list,
+            )
         nodes = graph.get("nodes", [])
         edges = graph.get("edges", [])
-        print("✓ 조회 성공")
-        print(f"  - object_type_id_list: {len(object_type_id_list)}개")
-        print(f"  - link_type_id_list: {len(link_type_id_list)}개")
-        print(f"  - nodes: {len(nodes)}")
-        print(f"  - edges: {len(edges)}")
+        _print("✓ 조회 성공")
+        _print(f"  - object_type_id_list: {len(object_type_id_list)}개")
+        _print(f"  - link_type_id_list: {len(link_type_id_list)}개")
+        _print(f"  - nodes: {len(nodes)}")
+        _print(f"  - edges: {len(edges)}")
     except Exception as e:
-        print(f"✗ 에러: {e}")
+        _report(e)
+
+
+@_buffered
+def example_knowledge_graph_batch():
+    """예제 20: KnowledgeGraph 조회 묶음 실행 (예제 17 + 18 동시 조회 후 출력)"""
+    _print("\n" + "=" * 80)
+    _print("예제 20: KnowledgeGraph 조회 묶음 실행 (예제 17 + 18)")
+    _print("=" * 80)
+
+    try:
+        by_name, by_list = client.knowledge_graph.batch([
+            {"op": "by_object_type_name", "object_type_name": KG_OBJECT_TYPE_NAME, "hop": KG_HOP},
+            {"op": "by_object_and_link_types",
+             "object_type_id_list": KG_OBJECT_TYPE_ID_LIST,
+             "link_type_id_list": KG_LINK_TYPE_ID_LIST},
+        ])
+    except Exception as e:
+        _report(e)
+        return
+
+    example_knowledge_graph_by_object_type_name(graph=by_name)
+    example_knowledge_graph_by_object_and_link_types(graph=by_list)
+
+
+async def run_examples_concurrently(*examples):
+    """
+    서로 독립적인 예제를 동시에 실행 (전체 소요 시간 ≈ 가장 느린 예제)
+
+    SDK 호출은 블로킹 HTTP이므로 각 예제를 asyncio.to_thread로 워커 스레드에서 실행합니다.
+    클라이언트 세션(커넥션 풀)은 모든 예제가 공유합니다.
+    예제 출력은 예제 단위로 모아서 내보내므로 서로 섞이지 않습니다 (예제 간 순서는 보장되지 않음).
+    """
+    await asyncio.gather(*(asyncio.to_thread(example) for example in examples))
 
 
 if __name__ == "__main__":
-    print("\n" + "=" * 80)
-    print("GraphIO Ontology SDK - 실제 데이터 조회 예제")
-    print("=" * 80)
+    _print("\n" + "=" * 80)
+    _print("GraphIO Ontology SDK - 실제 데이터 조회 예제")
+    _print("=" * 80)
 
     # 기본 예제 실행
     # example_basic_data_query()
@@ -730,6 +902,7 @@ if __name__ == "__main__":
     # example_automation_detail()
     # example_automation_set_active_by_name()
     # example_automation_execute_by_name()
+    # example_automation_execute_many_by_name()
     example_object_insert_batch()
     # example_object_update_batch()
     # example_object_delete_batch()
@@ -737,7 +910,15 @@ if __name__ == "__main__":
 
     # example_knowledge_graph_by_object_type_name()
     # example_knowledge_graph_by_object_and_link_types()
-
-    print("\n" + "=" * 80)
-    print("모든 예제 완료!")
-    print("=" * 80)
+    # example_knowledge_graph_batch()
+
+    # 독립적인 조회 예제 동시 실행
+    # asyncio.run(run_examples_concurrently(
+    #     example_basic_data_query,
+    #     example_knowledge_graph_by_object_type_name,
+    #     example_knowledge_graph_by_object_and_link_types,
+    # ))
+
+    _print("\n" + "=" * 80)
+    _print("모든 예제 완료!")
+    _print("=" * 80)
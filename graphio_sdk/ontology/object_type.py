@@ -2,7 +2,7 @@
 ObjectType 기본 클래스
 """
 
-from typing import List, Union, TYPE_CHECKING
+from typing import Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .query import ObjectSetQuery
@@ -18,7 +18,7 @@ class ObjectTypeBase:
     _object_type_id: str = None
     _object_type_name: str = None
     _client = None
-    _properties: List[str] = []
+    _properties: Tuple[str, ...] = ()
 
     def __init__(self):
         raise NotImplementedError(
@@ -2,11 +2,17 @@
 Ontology 네임스페이스 및 ObjectType 관리 (Lazy Loading Only)
 """
 
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+import functools
+import gzip
 import threading
 
-import requests
+from requests.exceptions import RequestException, Timeout
 
+from graphio_sdk import json_codec
+from graphio_sdk.cache import MISSING, TTLCache
 from .object_type import ObjectTypeBase
 from .operators import PropertyDescriptor
 from .edits import OntologyEditsBuilder
@@ -14,29 +20,191 @@ from .edits import OntologyEditsBuilder
 if TYPE_CHECKING:
     from graphio_sdk.client import GraphioClient
 
+# 서버에 없다고 확인된 ObjectType 이름을 기억하는 시간(초). 그동안 get_object_type은 재조회하지 않음
+MISSING_CACHE_TTL_SECONDS = 60
+
+# client.compress_requests=True일 때 이 크기(bytes) 이상의 요청 본문만 gzip 압축
+GZIP_MIN_BYTES = 64 * 1024
+
+# load_object_type의 Property 동시 조회용 공유 워커 수 (서로 다른 타입의 동시 로드 수만큼)
+LOAD_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=4096)
+def _property_descriptor(field_name: str) -> PropertyDescriptor:
+    """속성 이름별 PropertyDescriptor (상태가 field_name뿐이므로 모든 타입 클래스가 공유)"""
+    return PropertyDescriptor(field_name)
+
+
+def _type_class_body(
+        type_id: str,
+        name: str,
+        client: 'GraphioClient',
+        properties: Optional[List[str]],
+        **extra: Any
+) -> Dict[str, Any]:
+    """
+    ObjectType/LinkType 클래스 본문 구성
+
+    속성 디스크립터까지 미리 담아 type()을 한 번만 호출합니다.
+    (생성 후 setattr를 반복하면 속성마다 타입 속성 캐시가 무효화됨)
+    """
+    body: Dict[str, Any] = {
+        "_object_type_id": type_id,
+        "_object_type_name": name,
+        "_client": client,
+        # 튜플로 고정 - 호출자 리스트와 분리되고, 락 없이 읽는 쪽이 변경 중인 목록을 보지 않음
+        "_properties": tuple(properties) if properties else (),
+        **extra,
+    }
+    if properties:
+        for prop_name in properties:
+            body[prop_name] = _property_descriptor(prop_name)
+    return body
+
+
+def _message_converter(obj_type: type):
+    """
+    객체 타입 -> object message 변환 함수 (dict는 그대로)
+
+    클래스에 to_contract/to_message가 없으면 인스턴스에서 찾는 _instance_message를 반환합니다
+    (인스턴스 속성이나 __getattr__로 제공하는 프록시/Mock 등).
+    """
+    if issubclass(obj_type, dict):
+        return _identity
+    to_contract = getattr(obj_type, "to_contract", None)
+    if callable(to_contract):
+        return to_contract
+    to_message = getattr(obj_type, "to_message", None)
+    if callable(to_message):
+        return to_message
+    return _instance_message
+
+
+def _identity(obj):
+    return obj
+
+
+def _instance_message(obj):
+    """인스턴스의 to_contract() / to_message() 결과 (둘 다 없으면 None)"""
+    to_contract = getattr(obj, "to_contract", None)
+    if callable(to_contract):
+        return to_contract()
+    to_message = getattr(obj, "to_message", None)
+    if callable(to_message):
+        return to_message()
+    return None
+
 
 class OntologyNamespace:
     """ontology 네임스페이스 - Lazy Loading 전용"""
 
     def __init__(self, client: 'GraphioClient'):
         self.client = client
+        # 엔드포인트 URL은 client별로 고정이므로 한 번만 구성 (id/동작이 붙는 것은 접두어)
+        self._url_object_type = f"{client.api_base}/object-type"
+        self._url_object_type_prefix = self._url_object_type + "/"
+        self._url_object_type_property_prefix = f"{client.api_base}/object-type-property/"
+        self._url_objects_prefix = f"{client.api_base}/ontology-workflow/objects/"
+        self._url_select = self._url_objects_prefix + "select"
         self._object_types: Dict[str, type] = {}
         self._object_type_id_to_name: Dict[str, str] = {}
+        # 목록 조회 응답에서 본 이름 -> id (등록 전이라도 이름 검색 없이 id로 바로 로드)
+        self._object_type_name_to_id: Dict[str, str] = {}
         self._link_types: Dict[str, type] = {}
         self._link_type_id_to_name: Dict[str, str] = {}
-        self._cache_lock = threading.Lock()  # 스레드 안전성
+        # objects.<이름> / links.<이름> 접근용 네임스페이스
+        self._objects_namespace = SimpleNamespace()
+        self._links_namespace = SimpleNamespace()
+        self._cache_lock = threading.Lock()  # 스레드 안전성 (캐시 반영, clear_cache, 이름별 락 생성)
+        # 이름별 등록 락 - 서로 다른 타입의 등록은 직렬화하지 않음
+        self._name_locks: Dict[tuple, threading.Lock] = {}
+        # load_object_type 진행 중인 서버 조회 (같은 키의 동시 호출은 결과를 공유)
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # 서버에 없는 ObjectType 이름 (get_object_type 반복 조회 방지)
+        self._missing_names = TTLCache(maxsize=256, ttl=MISSING_CACHE_TTL_SECONDS)
+        # load_object_type의 Property 동시 조회용 워커 (처음 쓸 때 생성, 로드마다 스레드를 만들지 않음)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """공유 워커 반환 (동시 접근 시에도 하나만 생성)"""
+        executor = self._executor
+        if executor is None:
+            with self._cache_lock:
+                executor = self._executor
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=LOAD_WORKERS, thread_name_prefix="graphio-ontology"
+                    )
+                    self._executor = executor
+        return executor
+
+    def close(self):
+        """공유 워커 정리 (client.close()에서 호출, 이후 로드 시 다시 생성)"""
+        with self._cache_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     # ========================================================================
     # ObjectType 관련 API 호출 (ontology 전용)
     # ========================================================================
 
+    def _request(
+            self,
+            method: str,
+            url: str,
+            label: str,
+            params: Optional[Dict[str, Any]] = None,
+            body: Any = None
+    ) -> Any:
+        """
+        ontology API 공통 요청 - 응답 JSON 파싱 결과 반환
+
+        타임아웃/요청 실패/JSON이 아닌 응답 본문은 모두 "<label> ... : 원인" Exception으로 감쌉니다.
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            label: 에러 메시지 접두어 (예: "ObjectType 조회" -> "ObjectType 조회 실패: ...")
+            params: 쿼리 파라미터
+            body: JSON 요청 본문 (None이면 본문 없음)
+        """
+        data = None if body is None else json_codec.dumps(body)
+        headers = None
+        if data is not None and self.client.compress_requests and len(data) >= GZIP_MIN_BYTES:
+            data = gzip.compress(data)
+            headers = {"Content-Encoding": "gzip"}
+        try:
+            response = self.client._get_session().request(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=headers,
+                timeout=self.client.timeout
+            )
+            response.raise_for_status()
+            return json_codec.loads(response.content)
+        except Timeout as e:
+            raise Exception(
+                f"{label} 타임아웃 "
+                f"(timeout={self.client._format_timeout()}): {str(e)}"
+            ) from e
+        except RequestException as e:
+            raise Exception(f"{label} 실패: {str(e)}") from e
+        except ValueError as e:
+            # 본문이 JSON이 아닌 경우 (orjson/json 디코드 에러는 ValueError)
+            raise Exception(f"{label} 실패: {str(e)}") from e
+
     def _fetch_object_types(
             self,
             ontology_id: Optional[str] = None,
             name: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """서버에서 ObjectType 목록 가져오기"""
-        url = f"{self.client.api_base}/object-type"
+        url = self._url_object_type
 
         params = {}
         if ontology_id:
@@ -44,24 +212,17 @@ class OntologyNamespace:
         if name:
             params["name"] = name
 
-        try:
-            response = self.client._get_session().get(
-                url, params=params, timeout=self.client.timeout
-            )
-            response.raise_for_status()
-
-            result = response.json()
-            self.client._check_response(result, "fetch object types")
-
-            return result.get("data", [])
+        result = self._request("GET", url, "ObjectType 목록 조회", params=params)
+        self.client._check_response(result, "fetch object types")
+        data = result.get("data", [])
 
-        except requests.exceptions.Timeout as e:
-            raise Exception(
-                f"ObjectType 목록 조회 타임아웃 "
-                f"(timeout={self.client._format_timeout()}): {str(e)}"
-            ) from e
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"ObjectType 목록 조회 실패: {str(e)}") from e
+        name_to_id = self._object_type_name_to_id
+        for ot in data:
+            ot_name = ot.get("name")
+            ot_id = ot.get("id")
+            if ot_name and ot_id:
+                name_to_id[ot_name] = ot_id
+        return data
 
     def fetch_object_types(
             self,
@@ -82,51 +243,24 @@ class OntologyNamespace:
 
     def _fetch_object_type_by_id(self, object_type_id: str) -> Dict[str, Any]:
         """특정 ObjectType 상세 정보 가져오기"""
-        url = f"{self.client.api_base}/object-type/{object_type_id}"
-
-        try:
-            response = self.client._get_session().get(url, timeout=self.client.timeout)
-            response.raise_for_status()
-
-            result = response.json()
-
-            # CommonResponse 어노테이션이 있는 경우 data를 직접 반환
-            if isinstance(result, dict) and "id" in result:
-                return result
+        url = self._url_object_type_prefix + object_type_id
+        result = self._request("GET", url, "ObjectType 조회")
 
-            self.client._check_response(result, "fetch object type")
-            return result.get("data", {})
+        # CommonResponse 어노테이션이 있는 경우 data를 직접 반환
+        if isinstance(result, dict) and "id" in result:
+            return result
 
-        except requests.exceptions.Timeout as e:
-            raise Exception(
-                f"ObjectType 조회 타임아웃 "
-                f"(timeout={self.client._format_timeout()}): {str(e)}"
-            ) from e
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"ObjectType 조회 실패: {str(e)}") from e
+        self.client._check_response(result, "fetch object type")
+        return result.get("data", {})
 
     def _fetch_object_type_properties(
         self, object_type_id: str
     ) -> List[Dict[str, Any]]:
         """ObjectType의 Property 목록 가져오기"""
-        url = f"{self.client.api_base}/object-type-property/{object_type_id}"
-
-        try:
-            response = self.client._get_session().get(url, timeout=self.client.timeout)
-            response.raise_for_status()
-
-            result = response.json()
-            self.client._check_response(result, "fetch object type properties")
-
-            return result.get("data", [])
-
-        except requests.exceptions.Timeout as e:
-            raise Exception(
-                f"ObjectType Properties 조회 타임아웃 "
-                f"(timeout={self.client._format_timeout()}): {str(e)}"
-            ) from e
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"ObjectType Properties 조회 실패: {str(e)}") from e
+        url = self._url_object_type_property_prefix + object_type_id
+        result = self._request("GET", url, "ObjectType Properties 조회")
+        self.client._check_response(result, "fetch object type properties")
+        return result.get("data", [])
 
     def _execute_select(
         self, select_dto: Dict[str, Any]
@@ -140,105 +274,41 @@ class OntologyNamespace:
         Returns:
             조회된 실제 데이터 리스트
         """
-        url = f"{self.client.api_base}/ontology-workflow/objects/select"
-
-        try:
-            response = self.client._get_session().post(
-                url,
-                json=select_dto,
-                headers={"Content-Type": "application/json"},
-                timeout=self.client.timeout
-            )
-            response.raise_for_status()
-
-            result = response.json()
-            self.client._check_response(result, "select")
-
-            return result.get("data", [])
-
-        except requests.exceptions.Timeout as e:
-            raise Exception(
-                f"데이터 조회 타임아웃 "
-                f"(timeout={self.client._format_timeout()}): {str(e)}"
-            ) from e
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"데이터 조회 실패: {str(e)}") from e
+        url = self._url_select
+        result = self._request("POST", url, "데이터 조회", body=select_dto)
+        self.client._check_response(result, "select")
+        return result.get("data", [])
 
     # ========================================================================
     # ObjectSet 생성/수정 (HTTP API 호출, ontology 전용)
     # ========================================================================
 
+    def _execute_write(
+        self, action: str, messages: List[Dict[str, Any]], label: str
+    ) -> Dict[str, Any]:
+        """objects/{action} (insert/update/delete) 요청"""
+        url = self._url_objects_prefix + action
+        result = self._request("POST", url, label, body=messages)
+        self.client._check_response(result, label)
+        return result.get("data", result)
+
     def _execute_create(
         self, messages: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """생성 실행 - HTTP API로 요청"""
-        url = f"{self.client.api_base}/ontology-workflow/objects/insert"
-        try:
-            response = self.client._get_session().post(
-                url,
-                json=messages,
-                headers={"Content-Type": "application/json"},
-                timeout=self.client.timeout
-            )
-            response.raise_for_status()
-            result = response.json()
-            self.client._check_response(result, "객체 생성")
-            return result.get("data", result)
-        except requests.exceptions.Timeout as e:
-            raise Exception(
-                f"객체 생성 타임아웃 "
-                f"(timeout={self.client._format_timeout()}): {str(e)}"
-            ) from e
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"객체 생성 실패: {str(e)}") from e
+        return self._execute_write("insert", messages, "객체 생성")
 
     def _execute_update(
         self, messages: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """업데이트 실행 - HTTP API로 요청"""
-        url = f"{self.client.api_base}/ontology-workflow/objects/update"
-        try:
-            response = self.client._get_session().post(
-                url,
-                json=messages,
-                headers={"Content-Type": "application/json"},
-                timeout=self.client.timeout
-            )
-            response.raise_for_status()
-            result = response.json()
-            self.client._check_response(result, "객체 업데이트")
-            return result.get("data", result)
-        except requests.exceptions.Timeout as e:
-            raise Exception(
-                f"객체 업데이트 타임아웃 "
-                f"(timeout={self.client._format_timeout()}): {str(e)}"
-            ) from e
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"객체 업데이트 실패: {str(e)}") from e
+        return self._execute_write("update", messages, "객체 업데이트")
 
     def _execute_delete(
         self, messages: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """삭제 실행 - HTTP API로 요청"""
-        url = f"{self.client.api_base}/ontology-workflow/objects/delete"
-        try:
-            response = self.client._get_session().post(
-                url,
-                json=messages,
-                headers={"Content-Type": "application/json"},
-                timeout=self.client.timeout
-            )
-            response.raise_for_status()
-            result = response.json()
-            self.client._check_response(result, "객체 삭제")
-            return result.get("data", result)
-        except requests.exceptions.Timeout as e:
-            raise Exception(
-                f"객체 삭제 타임아웃 "
-                f"(timeout={self.client._format_timeout()}): {str(e)}"
-            ) from e
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"객체 삭제 실패: {str(e)}") from e
+        return self._execute_write("delete", messages, "객체 삭제")
 
     def _normalize_object_messages(
         self,
@@ -255,15 +325,16 @@ class OntologyNamespace:
         if not obj_list:
             raise ValueError(f"{method_name}()의 입력 객체가 비어 있습니다.")
 
+        # 변환 함수는 타입별로 한 번만 결정 (배치는 대부분 같은 타입으로 구성됨)
+        converters: Dict[type, Any] = {}
         messages: List[Dict[str, Any]] = []
         for obj in obj_list:
-            if isinstance(obj, dict):
-                message = obj
-            elif hasattr(obj, "to_contract"):
-                message = obj.to_contract()
-            elif hasattr(obj, "to_message"):
-                message = obj.to_message()
-            else:
+            obj_type = type(obj)
+            convert = converters.get(obj_type)
+            if convert is None:
+                convert = converters[obj_type] = _message_converter(obj_type)
+            message = convert(obj)
+            if message is None:
                 raise ValueError(
                     f"{method_name}()의 각 항목은 dict 이거나 "
                     "to_contract()/to_message()를 지원해야 합니다."
@@ -433,8 +504,10 @@ class OntologyNamespace:
         """
         Typed Object 또는 Link를 생성
 
+        리스트를 넘기면 insert_batch()와 같이 한 번의 요청으로 생성합니다.
+
         Args:
-            obj: TypedObject 또는 TypedLink 인스턴스
+            obj: TypedObject 또는 TypedLink 인스턴스 (또는 그 리스트)
 
         Returns:
             생성 결과
@@ -447,16 +520,21 @@ class OntologyNamespace:
             )
             client.ontology.insert(emp)
         """
-        contract = obj.to_contract()
-        messages = [contract]
+        messages = self._normalize_object_messages(
+            objs=obj,
+            require_element_id=False,
+            method_name="insert"
+        )
         return self._execute_create(messages)
 
     def update(self, obj):
         """
         Typed Object 또는 Link를 업데이트
 
+        리스트를 넘기면 한 번의 요청으로 업데이트합니다.
+
         Args:
-            obj: TypedObject 또는 TypedLink 인스턴스 (element_id 필수)
+            obj: TypedObject 또는 TypedLink 인스턴스 또는 그 리스트 (element_id 필수)
 
         Returns:
             업데이트 결과
@@ -469,20 +547,21 @@ class OntologyNamespace:
             )
             client.ontology.update(emp)
         """
-        if not obj.element_id:
-            raise ValueError(
-                "update()를 사용하려면 element_id가 필요합니다."
-            )
-        contract = obj.to_contract()
-        messages = [contract]
+        messages = self._normalize_object_messages(
+            objs=obj,
+            require_element_id=True,
+            method_name="update"
+        )
         return self._execute_update(messages)
 
     def delete(self, obj):
         """
         Typed Object 또는 Link를 삭제
 
+        리스트를 넘기면 한 번의 요청으로 삭제합니다.
+
         Args:
-            obj: TypedObject 또는 TypedLink 인스턴스 (element_id 필수)
+            obj: TypedObject 또는 TypedLink 인스턴스 또는 그 리스트 (element_id 필수)
 
         Returns:
             삭제 결과
@@ -492,12 +571,11 @@ class OntologyNamespace:
             emp = Employee(element_id="e-1")
             client.ontology.delete(emp)
         """
-        if not obj.element_id:
-            raise ValueError(
-                "delete()를 사용하려면 element_id가 필요합니다."
-            )
-        contract = obj.to_contract()
-        messages = [contract]
+        messages = self._normalize_object_messages(
+            objs=obj,
+            require_element_id=True,
+            method_name="delete"
+        )
         return self._execute_delete(messages)
 
     def register_object_type(
@@ -517,41 +595,105 @@ class OntologyNamespace:
         Returns:
             생성된 ObjectType 클래스
         """
+        # 캐시 히트는 락 없이 반환 (dict 조회는 GIL 하에서 원자적)
+        cls = self._object_types.get(name)
+        if cls is not None:
+            return cls
+
+        with self._name_lock("object", name):
+            # 락 대기 중 다른 스레드가 등록했을 수 있으므로 재확인
+            cls = self._object_types.get(name)
+            if cls is not None:
+                return cls
+
+            cls = self._build_object_type(name, object_type_id, properties)
+            with self._cache_lock:
+                return self._publish_object_type(name, object_type_id, cls)
+
+    def register_object_types(
+            self,
+            specs: List[Tuple[str, str, Optional[List[str]]]]
+    ) -> List[type]:
+        """
+        여러 ObjectType을 한 번에 수동 등록
+
+        클래스 생성은 락 밖에서 모두 끝내고, 캐시 반영만 한 번의 락 안에서 수행합니다.
+
+        Args:
+            specs: (name, object_type_id, properties) 튜플 리스트
+
+        Returns:
+            specs 순서대로 등록된 ObjectType 클래스 리스트 (이미 등록된 이름은 기존 클래스)
+
+        Example:
+            Employee, Ticket = client.ontology.register_object_types([
+                ("Employee", employee_id, ["name", "age"]),
+                ("Ticket", ticket_id, ["title"]),
+            ])
+        """
+        cached = self._object_types
+        built = [
+            (name, object_type_id, self._build_object_type(name, object_type_id, properties))
+            for name, object_type_id, properties in specs
+            if name not in cached
+        ]
         with self._cache_lock:
-            # 이미 등록된 경우 기존 클래스 반환
-            if name in self._object_types:
-                return self._object_types[name]
-
-            # 동적으로 클래스 생성 (query에서 _execute_select 호출을 위해 _ontology_namespace 전달)
-            cls = type(name, (ObjectTypeBase,), {
-                "_object_type_id": object_type_id,
-                "_object_type_name": name,
-                "_client": self.client,
-                "_ontology_namespace": self,
-                "_properties": properties or []
-            })
-
-            # 속성 디스크립터 동적 생성
-            if properties:
-                for prop_name in properties:
-                    setattr(cls, prop_name, PropertyDescriptor(prop_name))
-
-            self._object_types[name] = cls
-            self._object_type_id_to_name[object_type_id] = name
-
-            # objects 네임스페이스에 등록
-            setattr(self.objects, name, cls)
+            for name, object_type_id, cls in built:
+                self._publish_object_type(name, object_type_id, cls)
+            types = self._object_types
+            return [types[name] for name, _, _ in specs]
 
-            return cls
+    def _build_object_type(
+            self,
+            name: str,
+            object_type_id: str,
+            properties: Optional[List[str]]
+    ) -> type:
+        """ObjectType 클래스 생성 (캐시에는 반영하지 않음)"""
+        # query에서 _execute_select 호출을 위해 _ontology_namespace 전달
+        return type(name, (ObjectTypeBase,), _type_class_body(
+            object_type_id, name, self.client, properties,
+            _ontology_namespace=self,
+        ))
+
+    def _publish_object_type(self, name: str, object_type_id: str, cls: type) -> type:
+        """
+        생성한 클래스를 캐시에 반영 (_cache_lock 안에서 호출)
+
+        같은 이름이 먼저 등록되어 있으면 기존 클래스를 그대로 반환합니다.
+        """
+        existing = self._object_types.get(name)
+        if existing is not None:
+            return existing
+
+        # objects 네임스페이스에 등록
+        vars(self._objects_namespace)[name] = cls
+        self._missing_names.pop(name)
+        self._object_type_id_to_name[object_type_id] = name
+
+        # 완성된 클래스를 마지막에 한 번에 공개 (읽는 쪽은 미완성 클래스를 보지 않음)
+        self._object_types[name] = cls
+        return cls
+
+    def _name_lock(self, kind: str, name: str) -> threading.Lock:
+        """(kind, name)별 등록 락 반환 (없으면 생성)"""
+        key = (kind, name)
+        lock = self._name_locks.get(key)
+        if lock is None:
+            with self._cache_lock:
+                lock = self._name_locks.setdefault(key, threading.Lock())
+        return lock
 
     def add_property(self, object_type_name: str, property_name: str):
         """ObjectType에 속성 추가"""
-        if object_type_name not in self._object_types:
+        cls = self._object_types.get(object_type_name)
+        if cls is None:
             raise ValueError(f"ObjectType '{object_type_name}'이 등록되지 않았습니다.")
 
-        cls = self._object_types[object_type_name]
-        setattr(cls, property_name, PropertyDescriptor(property_name))
-        cls._properties.append(property_name)
+        with self._name_lock("object", object_type_name):
+            setattr(cls, property_name, _property_descriptor(property_name))
+            # _properties는 튜플 - 새 튜플로 교체 (copy-on-write)
+            cls._properties = cls._properties + (property_name,)
 
     def load_object_type(
             self,
@@ -561,6 +703,8 @@ class OntologyNamespace:
         """
         특정 ObjectType을 서버에서 가져와 등록
 
+        이름으로 조회해 서버에 없던 경우 MISSING_CACHE_TTL_SECONDS 동안은 재조회 없이 ValueError.
+
         Args:
             object_type_id: ObjectType UUID (id 또는 name 중 하나 필수)
             name: ObjectType 이름 (id 또는 name 중 하나 필수)
@@ -569,25 +713,88 @@ class OntologyNamespace:
             등록된 ObjectType 클래스
         """
         # name으로 이미 로드된 경우
-        if name and name in self._object_types:
-            return self._object_types[name]
+        # (clear_cache가 dict를 교체할 수 있으므로 한 번 잡은 참조로만 조회)
+        types = self._object_types
+        if name:
+            cls = types.get(name)
+            if cls is not None:
+                return cls
 
         # id로 이미 로드된 경우
-        if object_type_id and object_type_id in self._object_type_id_to_name:
-            cached_name = self._object_type_id_to_name[object_type_id]
-            return self._object_types[cached_name]
+        if object_type_id:
+            cached_name = self._object_type_id_to_name.get(object_type_id)
+            cls = types.get(cached_name) if cached_name else None
+            if cls is not None:
+                return cls
+        elif name and self._missing_names.get(name) is not MISSING:
+            # 최근 서버에 없다고 확인된 이름 - 재조회 없이 같은 에러
+            raise ValueError(f"ObjectType '{name}'을 찾을 수 없습니다.")
+
+        # 서버에서 로드 - 같은 대상의 동시 호출은 하나의 조회 결과를 공유 (single-flight)
+        key = ("id", object_type_id) if object_type_id else ("name", name)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            cls = self._load_object_type_from_server(object_type_id, name)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(cls)
+            return cls
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
 
-        # 서버에서 로드
+    def _load_object_type_from_server(
+            self,
+            object_type_id: Optional[str],
+            name: Optional[str]
+    ) -> type:
+        """서버에서 ObjectType 정보와 Property를 조회해 등록"""
+        cached_id = None
+        if not object_type_id and name:
+            # 이전 목록 조회(prefetch 등)에서 id를 알게 된 이름이면 검색 없이 id로 로드
+            cached_id = object_type_id = self._object_type_name_to_id.get(name)
+
+        requested_id = object_type_id
+        ot_data = None
+        properties = None
         if object_type_id:
-            ot_data = self._fetch_object_type_by_id(object_type_id)
-        elif name:
+            # id를 이미 알고 있으면 ObjectType 정보와 Property를 동시에 조회 (2 RTT -> 1 RTT)
+            properties_future = self._get_executor().submit(
+                self._fetch_object_type_properties, object_type_id
+            )
+            try:
+                ot_data = self._fetch_object_type_by_id(object_type_id)
+                properties = properties_future.result()
+            except Exception:
+                properties_future.cancel()
+                if cached_id is None:
+                    raise
+                # 목록 조회 이후 삭제/재생성된 타입일 수 있음 - 캐시된 id를 버리고 이름으로 재검색
+                name_to_id = self._object_type_name_to_id
+                if name_to_id.get(name) == cached_id:
+                    name_to_id.pop(name, None)
+                ot_data = properties = requested_id = None
+
+        if ot_data is None:
+            if not name:
+                raise ValueError("object_type_id 또는 name 중 하나는 필수입니다.")
             # name으로 검색
             results = self._fetch_object_types(name=name)
             if not results:
+                self._missing_names.set(name, True)
                 raise ValueError(f"ObjectType '{name}'을 찾을 수 없습니다.")
             ot_data = results[0]  # 첫 번째 결과 사용
-        else:
-            raise ValueError("object_type_id 또는 name 중 하나는 필수입니다.")
 
         object_type_id = ot_data.get("id")
         name = ot_data.get("name")
@@ -595,8 +802,9 @@ class OntologyNamespace:
         if not object_type_id or not name:
             raise ValueError(f"유효하지 않은 ObjectType 데이터: {ot_data}")
 
-        # Properties 가져오기
-        properties = self._fetch_object_type_properties(object_type_id)
+        # Properties 가져오기 (이름으로 조회한 경우에는 id를 안 뒤에야 가능)
+        if properties is None or object_type_id != requested_id:
+            properties = self._fetch_object_type_properties(object_type_id)
         property_names = [prop["name"] for prop in properties]
 
         # ObjectType 등록
@@ -607,6 +815,8 @@ class OntologyNamespace:
         ObjectType 클래스 가져오기 (Lazy Loading)
 
         캐시에 없으면 자동으로 서버에서 로드합니다.
+        서버에 없는 이름은 MISSING_CACHE_TTL_SECONDS 동안 재조회 없이 None을 반환합니다
+        (clear_cache() 또는 같은 이름 등록 시 해제).
 
         Args:
             name: ObjectType 이름
@@ -614,9 +824,14 @@ class OntologyNamespace:
         Returns:
             ObjectType 클래스 또는 None (로드 실패 시)
         """
-        # 캐시에서 찾기
-        if name in self._object_types:
-            return self._object_types[name]
+        # 캐시에서 찾기 (락 없음)
+        cls = self._object_types.get(name)
+        if cls is not None:
+            return cls
+
+        # 최근 서버에 없다고 확인된 이름이면 재조회하지 않음
+        if self._missing_names.get(name) is not MISSING:
+            return None
 
         # 자동 로드
         try:
@@ -625,6 +840,66 @@ class OntologyNamespace:
             # 로드 실패 시 None 반환
             return None
 
+    def prefetch(
+            self,
+            names: Optional[List[str]] = None,
+            max_workers: int = 16
+    ) -> List[type]:
+        """
+        여러 ObjectType을 한 번에 서버에서 가져와 등록
+
+        사용할 ObjectType을 미리 알고 있다면 시작 시 호출해 두세요.
+        get_object_type()마다 발생하는 개별 조회(타입 1회 + Property 1회)를
+        목록 1회 + Property 동시 조회로 줄입니다.
+
+        Args:
+            names: 등록할 ObjectType 이름 목록 (None이면 전체)
+            max_workers: Property 동시 조회 수 상한
+
+        Returns:
+            등록된 ObjectType 클래스 리스트 (이미 캐시된 타입 포함)
+
+        Example:
+            client.ontology.prefetch(["Employee", "Ticket"])
+            Employee = client.ontology.get_object_type("Employee")  # 서버 호출 없음
+        """
+        wanted = None if names is None else set(names)
+        if wanted is not None:
+            wanted.difference_update(self._object_types)
+            if not wanted:
+                return [self._object_types[n] for n in dict.fromkeys(names)]
+
+        # 목록은 1회 조회 후 클라이언트에서 필터링 (이름이 중복되면 첫 번째 결과 사용)
+        targets: Dict[str, Dict[str, Any]] = {}
+        for ot_data in self._fetch_object_types():
+            ot_name = ot_data.get("name")
+            if not ot_name or not ot_data.get("id") or ot_name in targets:
+                continue
+            if wanted is None or ot_name in wanted:
+                targets[ot_name] = ot_data
+
+        if wanted is not None:
+            missing = wanted.difference(targets)
+            if missing:
+                raise ValueError(f"ObjectType을 찾을 수 없습니다: {sorted(missing)}")
+
+        # Property 목록은 타입별 엔드포인트뿐이므로 동시에 조회
+        ids = [ot_data["id"] for ot_data in targets.values()]
+        if ids:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids)))) as executor:
+                properties_list = list(executor.map(self._fetch_object_type_properties, ids))
+        else:
+            properties_list = []
+
+        self.register_object_types([
+            (ot_name, ot_data["id"], [prop["name"] for prop in properties])
+            for (ot_name, ot_data), properties in zip(targets.items(), properties_list)
+        ])
+
+        if names is None:
+            return list(self._object_types.values())
+        return [self._object_types[n] for n in dict.fromkeys(names)]
+
     def list_object_types(self) -> List[str]:
         """
         캐시된 ObjectType 이름 목록
@@ -646,9 +921,10 @@ class OntologyNamespace:
         Returns:
             LinkType 클래스 또는 None (로드 실패 시)
         """
-        # 캐시에서 찾기
-        if name in self._link_types:
-            return self._link_types[name]
+        # 캐시에서 찾기 (락 없음)
+        cls = self._link_types.get(name)
+        if cls is not None:
+            return cls
 
         # 자동 로드
         try:
@@ -673,13 +949,19 @@ class OntologyNamespace:
             등록된 LinkType 클래스
         """
         # name으로 이미 로드된 경우
-        if name and name in self._link_types:
-            return self._link_types[name]
+        # (clear_cache가 dict를 교체할 수 있으므로 한 번 잡은 참조로만 조회)
+        types = self._link_types
+        if name:
+            cls = types.get(name)
+            if cls is not None:
+                return cls
 
         # id로 이미 로드된 경우
-        if link_type_id and link_type_id in self._link_type_id_to_name:
-            cached_name = self._link_type_id_to_name[link_type_id]
-            return self._link_types[cached_name]
+        if link_type_id:
+            cached_name = self._link_type_id_to_name.get(link_type_id)
+            cls = types.get(cached_name) if cached_name else None
+            if cls is not None:
+                return cls
 
         # 서버에서 로드 (LinkType API가 구현되면 사용)
         # 현재는 ObjectType과 동일한 구조로 구현
@@ -709,29 +991,25 @@ class OntologyNamespace:
         Returns:
             생성된 LinkType 클래스
         """
-        with self._cache_lock:
-            # 이미 등록된 경우 기존 클래스 반환
-            if name in self._link_types:
-                return self._link_types[name]
-
-            # 동적으로 클래스 생성 (ObjectType과 동일한 구조)
-            cls = type(name, (ObjectTypeBase,), {
-                "_object_type_id": link_type_id,  # LinkType도 동일한 구조 사용
-                "_object_type_name": name,
-                "_client": self.client,
-                "_properties": properties or []
-            })
-
-            # 속성 디스크립터 동적 생성
-            if properties:
-                for prop_name in properties:
-                    setattr(cls, prop_name, PropertyDescriptor(prop_name))
+        cls = self._link_types.get(name)
+        if cls is not None:
+            return cls
 
-            self._link_types[name] = cls
-            self._link_type_id_to_name[link_type_id] = name
+        with self._name_lock("link", name):
+            cls = self._link_types.get(name)
+            if cls is not None:
+                return cls
+
+            # 동적으로 클래스 생성 (ObjectType과 동일한 구조, LinkType id를 _object_type_id로 사용)
+            cls = type(name, (ObjectTypeBase,), _type_class_body(
+                link_type_id, name, self.client, properties
+            ))
 
             # links 네임스페이스에 등록
-            setattr(self.links, name, cls)
+            vars(self._links_namespace)[name] = cls
+            self._link_type_id_to_name[link_type_id] = name
+
+            self._link_types[name] = cls
 
             return cls
 
@@ -746,26 +1024,28 @@ class OntologyNamespace:
 
     def clear_cache(self):
         """캐시된 ObjectType과 LinkType 모두 제거"""
+        # 제자리 clear() 대신 새 객체로 참조를 교체 - 락 없이 읽는 쪽은 항상
+        # 교체 전 또는 교체 후의 완전한 dict만 보게 됨
+        objects_namespace = SimpleNamespace()
+        links_namespace = SimpleNamespace()
         with self._cache_lock:
-            self._object_types.clear()
-            self._object_type_id_to_name.clear()
-            self._link_types.clear()
-            self._link_type_id_to_name.clear()
-            self._objects_namespace = type('ObjectsNamespace', (), {})()
-            self._links_namespace = type('LinksNamespace', (), {})()
+            self._object_types = {}
+            self._object_type_id_to_name = {}
+            self._object_type_name_to_id = {}
+            self._link_types = {}
+            self._link_type_id_to_name = {}
+            self._objects_namespace = objects_namespace
+            self._links_namespace = links_namespace
+        self._missing_names.clear()
 
     @property
     def objects(self):
         """objects 네임스페이스 - 동적 속성 접근용"""
-        if not hasattr(self, '_objects_namespace'):
-            self._objects_namespace = type('ObjectsNamespace', (), {})()
         return self._objects_namespace
 
     @property
     def links(self):
         """links 네임스페이스 - 동적 속성 접근용"""
-        if not hasattr(self, '_links_namespace'):
-            self._links_namespace = type('LinksNamespace', (), {})()
         return self._links_namespace
 
     def edits(self) -> OntologyEditsBuilder:
@@ -21,36 +21,73 @@ class QueryOp(Enum):
 
 
 class Condition:
-    """단일 조건을 나타내는 클래스"""
+    """
+    단일 조건을 나타내는 클래스
+
+    만든 뒤에는 바꿀 수 없습니다 (field/op/value는 읽기 전용). 쿼리와 예제가 조건을 안전하게
+    재사용할 수 있도록 하기 위함이며, 값을 바꾸려면 새 Condition을 만드세요.
+    리스트 값은 내부에 tuple로 복사해 두고, value로 읽을 때는 새 리스트로 돌려줍니다.
+    """
+
+    __slots__ = ("_field", "_op", "_value")
 
     def __init__(self, field: str, op: QueryOp, value: Any = None):
-        self.field = field
-        self.op = op
-        self.value = value
+        self._field = field
+        self._op = op
+        self._value = tuple(value) if isinstance(value, list) else value
+
+    @property
+    def field(self) -> str:
+        return self._field
+
+    @property
+    def op(self) -> QueryOp:
+        return self._op
+
+    @property
+    def value(self) -> Any:
+        """조건 값 (리스트 값은 호출마다 새 리스트 - 수정해도 조건에 영향 없음)"""
+        value = self._value
+        return list(value) if isinstance(value, tuple) else value
 
     def to_dict(self) -> dict:
-        """조건을 딕셔너리로 변환"""
+        """조건을 딕셔너리로 변환 (호출마다 새 dict - 수정해도 조건에 영향 없음)"""
         result = {
-            "field": self.field,
-            "op": self.op.value
+            "field": self._field,
+            "op": self._op.value
         }
-        if self.value is not None:
+        if self._value is not None:
             result["value"] = self.value
         return result
 
 
 class LogicalCondition:
-    """AND/OR 논리 조건"""
+    """
+    AND/OR 논리 조건
+
+    Condition과 같이 만든 뒤에는 바꿀 수 없습니다 (operator/conditions는 읽기 전용).
+    """
+
+    __slots__ = ("_operator", "_conditions")
 
     def __init__(self, operator: str, conditions: List[Union['Condition', 'LogicalCondition']]):
-        self.operator = operator  # "and" or "or"
-        self.conditions = conditions
+        self._operator = operator  # "and" or "or"
+        self._conditions = tuple(conditions)
+
+    @property
+    def operator(self) -> str:
+        return self._operator
+
+    @property
+    def conditions(self) -> List[Union['Condition', 'LogicalCondition']]:
+        """하위 조건 목록 (호출마다 새 리스트)"""
+        return list(self._conditions)
 
     def to_dict(self) -> dict:
-        """논리 조건을 딕셔너리로 변환"""
+        """논리 조건을 딕셔너리로 변환 (호출마다 새 dict)"""
         return {
-            self.operator: [
-                cond.to_dict() for cond in self.conditions
+            self._operator: [
+                cond.to_dict() for cond in self._conditions
             ]
         }
 
@@ -58,6 +95,8 @@ class LogicalCondition:
 class PropertyDescriptor:
     """속성 디스크립터 - 쿼리 조건 생성용"""
 
+    __slots__ = ("field_name",)
+
     def __init__(self, field_name: str):
         self.field_name = field_name
 
@@ -84,8 +123,17 @@ class PropertyDescriptor:
         return Condition(self.field_name, QueryOp.LIKE, pattern)
 
     def is_in(self, values: List[Any]) -> Condition:
-        """IN 연산자"""
-        return Condition(self.field_name, QueryOp.IN, values)
+        """
+        IN 연산자
+
+        values는 순서를 유지한 채 중복을 제거해 복사해 둡니다 (이후 원본 리스트를 바꿔도
+        조건에 영향 없음, value로는 리스트로 읽힘). 해시 불가능한 값이 있으면 그대로 복사.
+        """
+        try:
+            unique = tuple(dict.fromkeys(values))
+        except TypeError:
+            unique = tuple(values)
+        return Condition(self.field_name, QueryOp.IN, unique)
 
     def is_null(self) -> Condition:
         """IS NULL 체크"""
@@ -2,7 +2,7 @@
 쿼리 빌더 클래스
 """
 
-from typing import List, Optional, Dict, Any, Union, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Sequence, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .operators import Condition, LogicalCondition
@@ -24,6 +24,7 @@ class ObjectSetQuery:
         self._select_all = False  # '*' 선택 여부
         self._conditions: List[Union['Condition', 'LogicalCondition']] = []
         self._limit_value: Optional[int] = None
+        self._where_dict: Optional[Dict[str, Any]] = None  # _build_where_clause 결과 (where() 시 초기화)
 
     def select(self, *fields: str) -> 'ObjectSetQuery':
         """
@@ -61,6 +62,7 @@ class ObjectSetQuery:
             자기 자신 (메서드 체이닝용)
         """
         self._conditions.extend(conditions)
+        self._where_dict = None
         return self
 
     def limit(self, count: int) -> 'ObjectSetQuery':
@@ -77,19 +79,21 @@ class ObjectSetQuery:
         return self
 
     def _build_where_clause(self) -> Optional[Dict[str, Any]]:
-        """where 조건을 API 형식으로 변환"""
+        """where 조건을 API 형식으로 변환 (조건이 바뀌기 전까지 재사용)"""
         from .operators import LogicalCondition
 
         if not self._conditions:
             return None
 
-        if len(self._conditions) == 1:
-            return self._conditions[0].to_dict()
-
-        # 여러 조건은 AND로 결합
-        return LogicalCondition("and", self._conditions).to_dict()
+        if self._where_dict is None:
+            if len(self._conditions) == 1:
+                self._where_dict = self._conditions[0].to_dict()
+            else:
+                # 여러 조건은 AND로 결합
+                self._where_dict = LogicalCondition("and", self._conditions).to_dict()
+        return self._where_dict
 
-    def _get_select_fields(self) -> List[str]:
+    def _get_select_fields(self) -> Sequence[str]:
         """
         선택할 필드 리스트 반환
 
@@ -117,6 +121,15 @@ class ObjectSetQuery:
             ValueError: select 필드가 없을 때
             Exception: API 호출 실패 시
         """
+        return self._run(self._build_dto())
+
+    def _build_dto(self, limit_override: Optional[int] = None) -> Dict[str, Any]:
+        """
+        ObjectSetSelectDto 구성 (쿼리 상태는 바꾸지 않음)
+
+        Args:
+            limit_override: 지정 시 limit() 값 대신 사용 (first() 등)
+        """
         select_fields = self._get_select_fields()
 
         # '*' 선택이 아니고 필드가 없으면 에러
@@ -133,10 +146,14 @@ class ObjectSetQuery:
         if where_clause:
             select_dto["where"] = where_clause
 
-        if self._limit_value:
-            select_dto["limit"] = self._limit_value
+        limit = limit_override if limit_override is not None else self._limit_value
+        if limit:
+            select_dto["limit"] = limit
+
+        return select_dto
 
-        # 실제 데이터 조회 (ontology namespace 전용)
+    def _run(self, select_dto: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """구성한 select_dto로 실제 데이터 조회 (ontology namespace 전용)"""
         if self._ontology_namespace is None:
             raise RuntimeError(
                 "select 실행을 위해 client.ontology.get_object_type() 또는 "
@@ -144,20 +161,46 @@ class ObjectSetQuery:
             )
         return self._ontology_namespace._execute_select(select_dto)
 
-    def count(self) -> int:
+    def execute_columnar(self) -> Dict[str, List[Any]]:
         """
-        조건에 맞는 레코드 개수 반환
+        쿼리 실행 - 결과를 컬럼 단위로 반환
+
+        행마다 dict를 들고 다니지 않고 필드별 리스트 하나씩으로 모읍니다.
+        select('*')이면 응답에 나온 필드 순서대로 컬럼을 만들고, 행에 없는 값은 None입니다.
 
         Returns:
-            레코드 개수
+            {필드명: [값, ...]} (모든 리스트의 길이는 행 수와 같음)
+
+        Raises:
+            ValueError: select 필드가 없을 때
+            Exception: API 호출 실패 시
         """
+        rows = self.execute()
+        fields = self._select_fields
+        if not fields:
+            fields = list(dict.fromkeys(key for row in rows for key in row))
+        return {field: [row.get(field) for row in rows] for field in fields}
+
+    def _probe_dto(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        count() / exists()용 최소 조회 요청 구성
+
+        행 본문이 필요 없으므로 필드 하나만 조회합니다. select()를 호출하지 않아도 됩니다.
+        ObjectType에 property가 없으면 '*'로 조회합니다.
+        """
+        if self._ontology_namespace is None:
+            raise RuntimeError(
+                "count/exists 실행을 위해 client.ontology.get_object_type() 또는 "
+                "load_object_type()으로 로드한 ObjectType을 사용하세요."
+            )
+
         # 첫 번째 필드만 선택해서 조회 (성능 최적화)
-        if not self._select_fields and self.object_type_class._properties:
-            temp_field = self.object_type_class._properties[0]
-        elif self._select_fields:
+        if self._select_fields:
             temp_field = self._select_fields[0]
+        elif self.object_type_class._properties:
+            temp_field = self.object_type_class._properties[0]
         else:
-            raise ValueError("count()를 사용하려면 ObjectType에 최소 하나의 property가 필요합니다.")
+            temp_field = "*"
 
         select_dto = {
             "select": [temp_field],
@@ -168,11 +211,21 @@ class ObjectSetQuery:
         if where_clause:
             select_dto["where"] = where_clause
 
-        if self._ontology_namespace is None:
-            raise RuntimeError(
-                "count 실행을 위해 client.ontology.get_object_type() 또는 "
-                "load_object_type()으로 로드한 ObjectType을 사용하세요."
-            )
+        if limit:
+            select_dto["limit"] = limit
+        return select_dto
+
+    def count(self) -> int:
+        """
+        조건에 맞는 레코드 개수 반환
+
+        서버에 COUNT 조회가 없어 조건에 맞는 행을 모두 받아 세므로, 건수가 많으면 그만큼 느립니다.
+        필드 하나(property가 없으면 '*')만 조회해 응답 크기만 줄입니다.
+
+        Returns:
+            레코드 개수
+        """
+        select_dto = self._probe_dto()
         result = self._ontology_namespace._execute_select(select_dto)
         return len(result)
 
@@ -183,20 +236,17 @@ class ObjectSetQuery:
         Returns:
             첫 번째 레코드 또는 None
         """
-        original_limit = self._limit_value
-        self._limit_value = 1
-
-        try:
-            result = self.execute()
-            return result[0] if result else None
-        finally:
-            self._limit_value = original_limit
+        result = self._run(self._build_dto(limit_override=1))
+        return result[0] if result else None
 
     def exists(self) -> bool:
         """
         조건에 맞는 레코드가 존재하는지 확인
 
+        필드 하나를 LIMIT 1로만 조회하므로 select() 없이 호출할 수 있습니다.
+
         Returns:
             존재 여부
         """
-        return self.first() is not None
\ No newline at end of file
+        select_dto = self._probe_dto(limit=1)
+        return bool(self._ontology_namespace._execute_select(select_dto))
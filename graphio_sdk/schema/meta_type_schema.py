@@ -10,13 +10,18 @@ MetaType API 응답 처리용 Pydantic 모델
     for item in raw_list:
         meta = MetaTypeDto.model_validate(item)  # 또는 MetaTypeDto.from_dict(item)
         print(meta.name, meta.id)
+
+    # JSON bytes가 있으면 dict로 풀지 않고 바로 파싱 (pydantic-core에서 파싱+검증)
+    meta = MetaTypeDto.from_json(response.content)
 """
+import functools
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 
+@functools.lru_cache(maxsize=512)
 def _to_camel(name: str) -> str:
     """snake_case -> camelCase (API JSON 키 매핑용)"""
     parts = name.split("_")
@@ -24,7 +29,33 @@ def _to_camel(name: str) -> str:
 
 
 # 공통 설정: camelCase alias 허용, 필드명으로도 입력 허용
-_common_config = ConfigDict(populate_by_name=True, extra="ignore")
+# defer_build: 검증 스키마는 import 시가 아니라 모델을 처음 검증할 때 구성 (쓰지 않는 DTO는 비용 없음)
+_common_config = ConfigDict(populate_by_name=True, extra="ignore", defer_build=True)
+# 필드명 -> camelCase alias 자동 생성 버전 (Field(alias=...)를 적지 않은 DTO용)
+_camel_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel, defer_build=True)
+
+_T = TypeVar("_T")
+
+
+# ---------- 공통 응답 래퍼 ----------
+
+
+class _ResponseEnvelope(BaseModel, Generic[_T]):
+    """
+    CommonResponse 래퍼 {"status", "error", "data"}
+
+    response.content(JSON 바이트)를 model_validate_json 으로 넘기면
+    중간 dict 없이 data 까지 DTO로 바로 파싱됩니다.
+    """
+    model_config = _common_config
+    status: Optional[bool] = None
+    error: Optional[Any] = None
+    data: Optional[_T] = None
+    total_size: Optional[int] = Field(None, alias="totalSize")  # 페이지 조회 시 전체 건수
+
+    def status_dict(self) -> Dict[str, Any]:
+        """GraphioClient._check_response 에 넘길 status/error dict (응답에 있던 키만)"""
+        return self.model_dump(include={"status", "error"} & self.model_fields_set)
 
 
 # ---------- Enums (Java enum 대응) ----------
@@ -67,6 +98,19 @@ class ConnectType(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# ---------- 원본 dict 래퍼 ----------
+
+
+class _RawDictDto(BaseModel):
+    """응답 dict를 raw에 그대로 담는 DTO 공통 베이스 (하위 클래스는 이름만 다름)"""
+    model_config = _common_config
+    raw: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "_RawDictDto":
+        return cls(raw=dict(d) if d else {})
+
+
 # ---------- TagDto ----------
 
 
@@ -80,13 +124,17 @@ class TagDto(BaseModel):
     def from_dict(cls, d: dict) -> "TagDto":
         return cls.model_validate(d)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "TagDto":
+        return cls.model_validate_json(data)
+
 
 # ---------- RawData DTOs ----------
 
 
 class MappedRawDataResponseDto(BaseModel):
     """매핑된 Raw Data 응답 DTO (Java MappedRawDataResponseDto 대응)"""
-    model_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel)
+    model_config = _camel_config
     id: str = ""
     owner_id: str = ""
     name: str = ""
@@ -97,20 +145,18 @@ class MappedRawDataResponseDto(BaseModel):
     def from_dict(cls, data: dict) -> "MappedRawDataResponseDto":
         return cls.model_validate(data)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "MappedRawDataResponseDto":
+        return cls.model_validate_json(data)
 
-class RawDataMetaResponseDto(BaseModel):
-    """Raw Data 메타 응답 DTO (Java RawDataMetaResponseDto 대응)"""
-    model_config = _common_config
-    raw: Dict[str, Any] = Field(default_factory=dict)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> "RawDataMetaResponseDto":
-        return cls(raw=dict(data) if data else {})
+class RawDataMetaResponseDto(_RawDictDto):
+    """Raw Data 메타 응답 DTO (Java RawDataMetaResponseDto 대응)"""
 
 
 class RawDataInfoResponseDto(BaseModel):
     """Raw Data 정보 응답 DTO (Java RawDataInfoResponseDto 대응)"""
-    model_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel)
+    model_config = _common_config
     id: Optional[str] = None
     resource_type: Optional[str] = Field(None, alias="resourceType")
     description: Optional[str] = None
@@ -125,15 +171,13 @@ class RawDataInfoResponseDto(BaseModel):
     def from_dict(cls, d: dict) -> "RawDataInfoResponseDto":
         return cls.model_validate(d)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "RawDataInfoResponseDto":
+        return cls.model_validate_json(data)
 
-class ObjectTypeMetaResponseDto(BaseModel):
-    """Object 타입 메타 응답 DTO (Java ObjectTypeMetaResponseDto 대응)"""
-    model_config = _common_config
-    raw: Dict[str, Any] = Field(default_factory=dict)
 
-    @classmethod
-    def from_dict(cls, d: dict) -> "ObjectTypeMetaResponseDto":
-        return cls(raw=dict(d) if d else {})
+class ObjectTypeMetaResponseDto(_RawDictDto):
+    """Object 타입 메타 응답 DTO (Java ObjectTypeMetaResponseDto 대응)"""
 
 
 # ---------- MetaTypePropertyResponseDto ----------
@@ -141,7 +185,7 @@ class ObjectTypeMetaResponseDto(BaseModel):
 
 class MetaTypePropertyResponseDto(BaseModel):
     """메타타입 속성 응답 DTO (Java MetaTypePropertyResponseDto 대응)"""
-    model_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel)
+    model_config = _common_config
     meta_type_id: Optional[str] = Field(None, alias="metaTypeId")
     id: Optional[str] = None
     name: Optional[str] = None
@@ -152,6 +196,10 @@ class MetaTypePropertyResponseDto(BaseModel):
     def from_dict(cls, d: dict) -> "MetaTypePropertyResponseDto":
         return cls.model_validate(d)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "MetaTypePropertyResponseDto":
+        return cls.model_validate_json(data)
+
 
 # ---------- Nested DTOs (READ_ONLY 등) ----------
 
@@ -162,7 +210,7 @@ class MetaTypePropertyDto(BaseModel):
     - id, createdAt, updatedAt(READ_ONLY), metaTypeId, ontologyId,
       dataType(PropertyDataType), metaTypePropertyName, rawDataPropertyName, description
     """
-    model_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel)
+    model_config = _common_config
     id: Optional[str] = None
     created_at: Optional[str] = Field(None, alias="createdAt")  # Timestamp
     updated_at: Optional[str] = Field(None, alias="updatedAt")  # Timestamp
@@ -177,35 +225,21 @@ class MetaTypePropertyDto(BaseModel):
     def from_dict(cls, d: dict) -> "MetaTypePropertyDto":
         return cls.model_validate(d)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "MetaTypePropertyDto":
+        return cls.model_validate_json(data)
 
-class MetaMappingDto(BaseModel):
-    """메타 매핑 DTO (Java MetaMappingDto 대응)"""
-    model_config = _common_config
-    raw: Dict[str, Any] = Field(default_factory=dict)
 
-    @classmethod
-    def from_dict(cls, d: dict) -> "MetaMappingDto":
-        return cls(raw=dict(d) if d else {})
+class MetaMappingDto(_RawDictDto):
+    """메타 매핑 DTO (Java MetaMappingDto 대응)"""
 
 
-class ObjectMappingDto(BaseModel):
+class ObjectMappingDto(_RawDictDto):
     """오브젝트 매핑 DTO (Java ObjectMappingDto 대응)"""
-    model_config = _common_config
-    raw: Dict[str, Any] = Field(default_factory=dict)
 
-    @classmethod
-    def from_dict(cls, d: dict) -> "ObjectMappingDto":
-        return cls(raw=dict(d) if d else {})
 
-
-class MetaTypeTagMappingDto(BaseModel):
+class MetaTypeTagMappingDto(_RawDictDto):
     """메타타입-태그 매핑 DTO (Java MetaTypeTagMappingDto 대응)"""
-    model_config = _common_config
-    raw: Dict[str, Any] = Field(default_factory=dict)
-
-    @classmethod
-    def from_dict(cls, d: dict) -> "MetaTypeTagMappingDto":
-        return cls(raw=dict(d) if d else {})
 
 
 # ---------- MetaTypeInspectDto ----------
@@ -213,7 +247,7 @@ class MetaTypeTagMappingDto(BaseModel):
 
 class MetaTypeInspectDto(BaseModel):
     """메타타입 상세 조회(inspect) 응답 DTO (Java MetaTypeInspectDto 대응)"""
-    model_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel)
+    model_config = _common_config
     id: Optional[str] = None
     ontology_id: Optional[str] = Field(None, alias="ontologyId")
     owner_id: Optional[str] = Field(None, alias="ownerId")
@@ -232,16 +266,22 @@ class MetaTypeInspectDto(BaseModel):
     create_table: Optional[bool] = Field(None, alias="createTable")
     raw_data_meta_response_dto_list: Optional[List[RawDataMetaResponseDto]] = Field(None, alias="rawDataMetaResponseDtoList")
     object_meta_response_dto_list: Optional[List[ObjectTypeMetaResponseDto]] = Field(None, alias="objectMetaResponseDtoList")
-    meta_mapping_dto_list: Optional[List[MetaMappingDto]] = Field(None, alias="metaMappingDtoList")
+    # Java 쪽 MetaMappingDtoList(대문자 M) 키도 지원 (둘 다 있으면 metaMappingDtoList 우선)
+    meta_mapping_dto_list: Optional[List[MetaMappingDto]] = Field(
+        None,
+        alias="metaMappingDtoList",
+        validation_alias=AliasChoices("metaMappingDtoList", "MetaMappingDtoList"),
+    )
     object_mapping_dto_list: Optional[List[ObjectMappingDto]] = Field(None, alias="objectMappingDtoList")
 
     @classmethod
     def from_dict(cls, d: dict) -> "MetaTypeInspectDto":
-        # Java 쪽 MetaMappingDtoList(대문자 M) 키 지원
-        if isinstance(d, dict) and "MetaMappingDtoList" in d and "metaMappingDtoList" not in d:
-            d = {**d, "metaMappingDtoList": d["MetaMappingDtoList"]}
         return cls.model_validate(d)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "MetaTypeInspectDto":
+        return cls.model_validate_json(data)
+
 
 # ---------- CheckMetaTypeNameDto ----------
 
@@ -257,13 +297,17 @@ class CheckMetaTypeNameDto(BaseModel):
     def from_dict(cls, d: dict) -> "CheckMetaTypeNameDto":
         return cls.model_validate(d)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "CheckMetaTypeNameDto":
+        return cls.model_validate_json(data)
+
 
 # ---------- MetaTypeDto ----------
 
 
 class MetaTypeDto(BaseModel):
     """메타타입 DTO (Java MetaTypeDto 대응)"""
-    model_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel)
+    model_config = _common_config
     id: Optional[str] = None
     ontology_id: Optional[str] = Field(None, alias="ontologyId")
     owner_id: Optional[str] = Field(None, alias="ownerId")
@@ -291,20 +335,7 @@ class MetaTypeDto(BaseModel):
     def from_dict(cls, d: dict) -> "MetaTypeDto":
         return cls.model_validate(d)
 
-
-# ---------- Page (raw-datas 등) ----------
-
-
     @classmethod
-    def from_dict(cls, d: dict) -> "PageResponseDto":
-        if not isinstance(d, dict):
-            raise TypeError("dict expected")
-        content_raw = d.get("content", d.get("data", []))
-        content = [MappedRawDataResponseDto.model_validate(i) for i in content_raw] if isinstance(content_raw, list) else []
-        return cls(
-            content=content,
-            total_elements=d.get("totalElements"),
-            total_pages=d.get("totalPages"),
-            size=d.get("size"),
-            number=d.get("number"),
-        )
+    def from_json(cls, data: bytes) -> "MetaTypeDto":
+        return cls.model_validate_json(data)
+
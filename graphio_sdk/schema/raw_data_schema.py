@@ -3,9 +3,9 @@ Raw Data API 응답 처리용 Pydantic 모델
 """
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
-from graphio_sdk.schema.meta_type_schema import _common_config, _to_camel
+from graphio_sdk.schema.meta_type_schema import _common_config
 
 
 class RawDataConnectionDto(BaseModel):
@@ -18,10 +18,14 @@ class RawDataConnectionDto(BaseModel):
     def from_dict(cls, d: dict) -> "RawDataConnectionDto":
         return cls.model_validate(d)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "RawDataConnectionDto":
+        return cls.model_validate_json(data)
+
 
 class RawDataLocationDto(BaseModel):
     """테이블 원천 데이터 위치 정보"""
-    model_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel)
+    model_config = _common_config
     database_name: Optional[str] = Field(None, alias="databaseName")
     schema_name: Optional[str] = Field(None, alias="schemaName")
     table_name: Optional[str] = Field(None, alias="tableName")
@@ -30,10 +34,14 @@ class RawDataLocationDto(BaseModel):
     def from_dict(cls, d: dict) -> "RawDataLocationDto":
         return cls.model_validate(d)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "RawDataLocationDto":
+        return cls.model_validate_json(data)
+
 
 class RawDataSourceInfoDto(BaseModel):
     """원천 데이터 연결 정보 응답 DTO (GET /raw-data/{id}/source-info)"""
-    model_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel)
+    model_config = _common_config
     data_type: Optional[str] = Field(None, alias="dataType")
     connection: Optional[RawDataConnectionDto] = None
     full_path: Optional[str] = Field(None, alias="fullPath")
@@ -45,10 +53,14 @@ class RawDataSourceInfoDto(BaseModel):
     def from_dict(cls, d: dict) -> "RawDataSourceInfoDto":
         return cls.model_validate(d)
 
+    @classmethod
+    def from_json(cls, data: bytes) -> "RawDataSourceInfoDto":
+        return cls.model_validate_json(data)
+
 
 class RawDataListItemDto(BaseModel):
     """원천 데이터 목록 항목 DTO (GET /raw-data)"""
-    model_config = ConfigDict(populate_by_name=True, extra="ignore", alias_generator=_to_camel)
+    model_config = _common_config
     raw_data_id: Optional[str] = Field(None, alias="rawDataId")
     connect_type: Optional[str] = Field(None, alias="connectType")
     connection_instance_name: Optional[str] = Field(None, alias="connectionInstanceName")
@@ -61,3 +73,7 @@ class RawDataListItemDto(BaseModel):
     @classmethod
     def from_dict(cls, d: dict) -> "RawDataListItemDto":
         return cls.model_validate(d)
+
+    @classmethod
+    def from_json(cls, data: bytes) -> "RawDataListItemDto":
+        return cls.model_validate_json(data)
@@ -0,0 +1,99 @@
+"""
+테스트 공통 fixture - 실제 서버 대신 요청을 기록하고 정해진 응답을 돌려주는 가짜 세션
+"""
+
+import io
+import json
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import pytest
+import requests
+
+from graphio_sdk import GraphioClient
+
+# 응답 지정: dict/list(JSON으로 직렬화), bytes(본문 그대로), 또는 요청 kwargs -> 앞의 값
+Route = Union[Any, bytes, Callable[[Dict[str, Any]], Any]]
+
+
+class FakeResponse:
+    """requests.Response 중 SDK가 쓰는 부분만 흉내"""
+
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
+        self.raw = io.BytesIO(content)  # stream=True 경로용
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeSession:
+    """
+    URL 끝부분(경로)으로 응답을 고르는 가짜 세션
+
+    호출은 (method, url, kwargs)로 calls에 기록됩니다. 일치하는 경로가 없으면 AssertionError.
+    """
+
+    def __init__(self, routes: Dict[str, Route]):
+        self.routes = routes
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.headers: Dict[str, str] = {}
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls.append((method, url, kwargs))
+        # 가장 긴 경로부터 비교 (/meta-type 과 /meta-type/tag-list 구분)
+        for path in sorted(self.routes, key=len, reverse=True):
+            if url.endswith(path):
+                payload = self.routes[path]
+                if callable(payload):
+                    payload = payload(kwargs)
+                if isinstance(payload, FakeResponse):
+                    return payload
+                if isinstance(payload, bytes):
+                    return FakeResponse(payload)
+                return FakeResponse(json.dumps(payload).encode("utf-8"))
+        raise AssertionError(f"예상하지 못한 요청: {method} {url}")
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> FakeResponse:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_client():
+    """
+    make_client(routes, **client_kwargs) -> (GraphioClient, FakeSession)
+
+    Example:
+        client, session = make_client({"/meta-type/tag-list": {"status": True, "data": []}})
+    """
+    clients = []
+
+    def _make(routes: Dict[str, Route], **client_kwargs: Any):
+        client = GraphioClient(base_url="http://graphio.test", **client_kwargs)
+        session = FakeSession(routes)
+        client._session = session
+        clients.append(client)
+        return client, session
+
+    yield _make
+    for client in clients:
+        client._session = None
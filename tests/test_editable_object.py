@@ -0,0 +1,41 @@
+"""EditableObject 속성 처리"""
+
+import pytest
+
+from graphio_sdk.ontology.edits import EditableObject
+
+
+def test_public_attributes_go_to_properties():
+    obj = EditableObject("ot1", {"name": "a"})
+    obj.age = 3
+    assert obj.age == 3
+    assert obj.to_message() == {"objectTypeId": "ot1", "properties": {"name": "a", "age": 3}}
+
+
+def test_private_attributes_stay_off_the_payload():
+    obj = EditableObject("ot1", {"name": "a"}, element_id="e1")
+    obj._tmp = 1
+    assert obj._tmp == 1
+    assert obj.get_properties() == {"name": "a"}
+    assert "_tmp" not in obj.to_message()["properties"]
+
+
+def test_fixed_fields_are_not_properties():
+    obj = EditableObject("ot1", {})
+    obj.element_id = "e2"
+    assert obj.to_message() == {"objectTypeId": "ot1", "properties": {}, "elementId": "e2"}
+
+
+def test_missing_attribute_raises():
+    obj = EditableObject("ot1", {})
+    with pytest.raises(AttributeError):
+        obj.missing
+    with pytest.raises(AttributeError):
+        obj._missing
+
+
+def test_instances_have_no_dict():
+    obj = EditableObject("ot1", {})
+    obj._tmp = 1
+    assert not hasattr(obj, "__dict__")
+    assert obj._private == {"_tmp": 1}
@@ -0,0 +1,52 @@
+"""응답 래퍼(_ResponseEnvelope) 파싱 경로의 에러 응답 처리"""
+
+import pytest
+from pydantic import ValidationError
+
+from graphio_sdk.schema import RawDataSourceInfoDto
+
+ERROR_ENVELOPE = {
+    "status": False,
+    "error": {"code": "E404", "description": "not found", "errorMessage": "no meta type"},
+    "data": {},
+}
+
+# (라우트 경로, 호출, 성공 응답에서 data 형식이 다를 때의 기대값)
+ENVELOPE_METHODS = [
+    ("/meta-type", lambda c: c.meta_type.manage.list(), []),
+    ("/meta-type/raw-datas", lambda c: c.meta_type.manage.raw_datas("m1", 0, 10), []),
+    ("/meta-type/inspect/property/m1", lambda c: c.meta_type.manage.inspect_property("m1"), []),
+    ("/meta-type/tag-list", lambda c: c.meta_type.etc.tag_list(), []),
+    ("/raw-data", lambda c: c.raw_data.list(), []),
+    ("/raw-data/r1/source-info", lambda c: c.raw_data.source_info("r1"), RawDataSourceInfoDto()),
+]
+
+
+@pytest.mark.parametrize("path, call, _", ENVELOPE_METHODS)
+def test_error_envelope_raises_api_error(make_client, path, call, _):
+    client, _session = make_client({path: ERROR_ENVELOPE})
+    with pytest.raises(Exception) as excinfo:
+        call(client)
+    assert not isinstance(excinfo.value, ValidationError)
+    assert "[E404] not found - no meta type" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("path, call, empty", ENVELOPE_METHODS)
+def test_success_with_unexpected_data_shape_returns_empty(make_client, path, call, empty):
+    data = [] if isinstance(empty, RawDataSourceInfoDto) else {}
+    client, _session = make_client({path: {"status": True, "data": data}})
+    assert call(client) == empty
+
+
+def test_invalid_items_still_raise_validation_error(make_client):
+    client, _session = make_client({"/meta-type/tag-list": {"status": True, "data": [{"id": ["x"]}]}})
+    with pytest.raises(ValidationError):
+        client.meta_type.etc.tag_list()
+
+
+def test_success_envelope_is_parsed(make_client):
+    client, _session = make_client(
+        {"/meta-type/tag-list": {"status": True, "data": [{"id": "t1", "name": "tag"}]}}
+    )
+    tags = client.meta_type.etc.tag_list()
+    assert [(t.id, t.name) for t in tags] == [("t1", "tag")]
@@ -0,0 +1,93 @@
+"""action_type/automation 이름 -> id 캐시 - 오래된 id 재시도, id_cache_ttl"""
+
+import pytest
+
+from tests.conftest import FakeResponse
+
+ACTION_DETAIL = "/action-type/detail"
+AUTOMATION_DETAIL = "/automation/detail"
+OK = {"status": True, "data": {"runId": "r1", "runStatus": "SUCCESS", "completed": True}}
+
+
+def _detail_returning(*ids):
+    remaining = list(ids)
+
+    def detail(kwargs):
+        return {"status": True, "data": {"id": remaining.pop(0)}}
+
+    return detail
+
+
+def _calls_to(session, path):
+    return [url for _method, url, _kwargs in session.calls if url.endswith(path)]
+
+
+def test_action_type_retries_by_name_when_cached_id_is_stale(make_client):
+    client, session = make_client({
+        ACTION_DETAIL: _detail_returning("new"),
+        "/action-type/old/execute": FakeResponse(b"", status_code=404),
+        "/action-type/new/execute": OK,
+    })
+    action_type = client.action_type
+    action_type._id_cache.set("Approve", "old")
+
+    result = action_type.execute_by_name("Approve", [])
+
+    assert result["run_id"] == "r1"
+    assert len(_calls_to(session, ACTION_DETAIL)) == 1
+    # 새 id가 캐시되어 다음 호출은 detail 없이 바로 실행
+    action_type.execute_by_name("Approve", [])
+    assert len(_calls_to(session, ACTION_DETAIL)) == 1
+    assert len(_calls_to(session, "/action-type/new/execute")) == 2
+
+
+def test_same_id_after_refetch_raises_original_error_without_rerun(make_client):
+    client, session = make_client({
+        AUTOMATION_DETAIL: _detail_returning("a1"),
+        "/automation/a1/execute": FakeResponse(b"", status_code=500),
+    })
+    automation = client.automation
+    automation._id_cache.set("Nightly", "a1")
+
+    with pytest.raises(Exception, match="500"):
+        automation.execute_by_name("Nightly")
+    assert len(_calls_to(session, "/automation/a1/execute")) == 1
+
+
+def test_automation_set_active_retries_on_api_error(make_client):
+    client, session = make_client({
+        AUTOMATION_DETAIL: _detail_returning("new"),
+        "/automation/old/active": {"status": False, "error": {"code": "NOT_FOUND"}},
+        "/automation/new/active": {"status": True, "data": True},
+    })
+    automation = client.automation
+    automation._id_cache.set("Nightly", "old")
+
+    assert automation.set_active_by_name("Nightly", True) == {"status": True, "active": True}
+
+
+@pytest.mark.parametrize("ttl", [None, 0])
+def test_id_cache_can_be_disabled(make_client, ttl):
+    client, session = make_client({
+        ACTION_DETAIL: _detail_returning("a1", "a1"),
+        "/action-type/a1/execute": OK,
+    }, id_cache_ttl=ttl)
+
+    client.action_type.execute_by_name("Approve", [])
+    client.action_type.execute_by_name("Approve", [])
+
+    assert len(_calls_to(session, ACTION_DETAIL)) == 2
+
+
+def test_execute_many_runs_every_entry_but_resolves_each_name_once(make_client):
+    client, session = make_client({
+        AUTOMATION_DETAIL: lambda kwargs: {"status": True, "data": {"id": kwargs["params"]["name"].lower()}},
+        "/automation/nightly/execute": {"status": True, "data": "x1"},
+        "/automation/weekly/execute": {"status": True, "data": "x2"},
+    }, id_cache_ttl=None)
+
+    results = client.automation.execute_many_by_name(["Nightly", "Weekly", "Nightly"])
+
+    assert [r["execution_id"] for r in results] == ["x1", "x2", "x1"]
+    assert len(_calls_to(session, AUTOMATION_DETAIL)) == 2
+    assert len(_calls_to(session, "/automation/nightly/execute")) == 2
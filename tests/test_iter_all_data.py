@@ -0,0 +1,68 @@
+"""MetaTableAPI.iter_all_data - ijson 스트리밍 경로와 ijson 없는 경로"""
+
+import json
+
+import pytest
+
+from graphio_sdk.data_pipline import meta_type as meta_type_module
+
+ijson = pytest.importorskip("ijson")
+
+ROWS = [{"a": 1, "b": [1, {"c": 2.5}]}, {"a": 2}, 3, [1, [2]]]
+ERROR = {"code": "E500", "description": "boom", "errorMessage": "all-data failed"}
+
+
+def _body(*pairs):
+    """키 순서를 지정한 응답 본문 (status/error가 data 앞인지 뒤인지 테스트)"""
+    return json.dumps(dict(pairs)).encode("utf-8")
+
+
+def test_streams_rows_with_stream_request(make_client):
+    client, session = make_client(
+        {"/meta-type/all-data": _body(("status", True), ("data", ROWS), ("totalSize", 4))}
+    )
+    assert list(client.meta_type.table_data.iter_all_data("m1")) == ROWS
+    _method, _url, kwargs = session.calls[0]
+    assert kwargs["stream"] is True
+    assert kwargs["params"] == {"metaTypeId": "m1"}
+
+
+def test_rows_are_yielded_lazily(make_client):
+    client, _session = make_client({"/meta-type/all-data": _body(("status", True), ("data", ROWS))})
+    rows = client.meta_type.table_data.iter_all_data("m1")
+    assert next(rows) == ROWS[0]
+    rows.close()
+
+
+def test_error_envelope_raises_before_any_row(make_client):
+    client, _session = make_client(
+        {"/meta-type/all-data": _body(("status", False), ("error", ERROR), ("data", ROWS))}
+    )
+    rows = client.meta_type.table_data.iter_all_data("m1")
+    with pytest.raises(Exception, match=r"\[E500\] boom - all-data failed"):
+        next(rows)
+
+
+def test_status_false_without_error_yields_nothing_and_raises(make_client):
+    client, _session = make_client({"/meta-type/all-data": _body(("status", False), ("data", ROWS))})
+    received = []
+    with pytest.raises(Exception, match="list all-data 실패"):
+        for row in client.meta_type.table_data.iter_all_data("m1"):
+            received.append(row)
+    assert received == []
+
+
+def test_trailing_error_raises_after_rows(make_client):
+    client, _session = make_client({"/meta-type/all-data": _body(("data", ROWS[:2]), ("error", ERROR))})
+    received = []
+    with pytest.raises(Exception, match="E500"):
+        for row in client.meta_type.table_data.iter_all_data("m1"):
+            received.append(row)
+    assert received == ROWS[:2]
+
+
+def test_without_ijson_falls_back_to_all_data(make_client, monkeypatch):
+    monkeypatch.setattr(meta_type_module, "ijson", None)
+    client, session = make_client({"/meta-type/all-data": {"status": True, "data": ROWS, "totalSize": 4}})
+    assert list(client.meta_type.table_data.iter_all_data("m1")) == ROWS
+    assert "stream" not in session.calls[0][2]
@@ -0,0 +1,48 @@
+"""_iter_pages - 페이지 순서 유지와 미리 받는 페이지 수 제한"""
+
+import threading
+
+from graphio_sdk.data_pipline.meta_type import _iter_pages
+
+
+def _paged(total: int, size: int):
+    requested = []
+    lock = threading.Lock()
+
+    def fetch_page(page):
+        with lock:
+            requested.append(page)
+        start = page * size
+        return list(range(start, min(start + size, total))), total
+
+    return fetch_page, requested
+
+
+def test_pages_are_yielded_in_order():
+    fetch_page, _ = _paged(total=95, size=10)
+
+    assert list(_iter_pages(fetch_page, size=10, max_workers=3)) == list(range(95))
+
+
+def test_in_flight_pages_are_bounded_by_window():
+    fetch_page, requested = _paged(total=1000, size=10)  # 100페이지
+    rows = _iter_pages(fetch_page, size=10, max_workers=2)
+
+    # 0페이지 + 1페이지 첫 행까지만 소비
+    for _ in range(11):
+        next(rows)
+
+    # 0페이지, 처음 제출한 2 * max_workers 페이지, 1페이지를 꺼내며 제출한 1페이지
+    assert len(requested) <= 1 + 2 * 2 + 1
+    rows.close()
+
+
+def test_unknown_total_fetches_until_short_page():
+    calls = []
+
+    def fetch_page(page):
+        calls.append(page)
+        return ([page] * 10 if page < 2 else [page] * 3), None
+
+    assert list(_iter_pages(fetch_page, size=10, max_workers=4)) == [0] * 10 + [1] * 10 + [2] * 3
+    assert calls == [0, 1, 2]
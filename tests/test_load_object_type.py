@@ -0,0 +1,115 @@
+"""load_object_type 서버 로드 - single-flight, 없는 이름 캐시, 오래된 이름 -> id"""
+
+import threading
+import time
+
+import pytest
+
+from tests.conftest import FakeResponse
+
+OBJECT_TYPE = "/graphio/v1/object-type"
+EMPLOYEE_LIST = {"status": True, "data": [{"id": "ot-1", "name": "Employee"}]}
+EMPLOYEE_PROPERTIES = {"status": True, "data": [{"name": "name"}, {"name": "age"}]}
+
+
+def _calls_to(session, path):
+    return [url for _method, url, _kwargs in session.calls if url.endswith(path)]
+
+
+def test_concurrent_loads_share_one_request(make_client):
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_list(kwargs):
+        entered.set()
+        release.wait(5)
+        return EMPLOYEE_LIST
+
+    client, session = make_client({
+        OBJECT_TYPE: slow_list,
+        "/object-type-property/ot-1": EMPLOYEE_PROPERTIES,
+    })
+    ontology = client.ontology
+    results = []
+
+    def load():
+        results.append(ontology.load_object_type(name="Employee"))
+
+    first = threading.Thread(target=load)
+    first.start()
+    assert entered.wait(5)
+    second = threading.Thread(target=load)
+    second.start()
+    time.sleep(0.05)  # 두 번째 호출이 진행 중인 조회를 기다리도록
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert len(results) == 2 and results[0] is results[1]
+    assert len(_calls_to(session, OBJECT_TYPE)) == 1
+    assert ontology._inflight == {}
+
+
+def test_missing_name_is_not_refetched(make_client):
+    client, session = make_client({OBJECT_TYPE: {"status": True, "data": []}})
+    ontology = client.ontology
+
+    with pytest.raises(ValueError):
+        ontology.load_object_type(name="Ghost")
+    with pytest.raises(ValueError):
+        ontology.load_object_type(name="Ghost")
+    assert ontology.get_object_type("Ghost") is None
+    assert len(session.calls) == 1
+
+    ontology.clear_cache()
+    assert ontology.get_object_type("Ghost") is None
+    assert len(session.calls) == 2
+
+
+def test_stale_name_to_id_falls_back_to_name_search(make_client):
+    client, session = make_client({
+        OBJECT_TYPE: EMPLOYEE_LIST,
+        "/object-type/ot-old": FakeResponse(b"", status_code=404),
+        "/object-type-property/ot-old": FakeResponse(b"", status_code=404),
+        "/object-type-property/ot-1": EMPLOYEE_PROPERTIES,
+    })
+    ontology = client.ontology
+    # 이전 목록 조회에서 본 id - 그 뒤 서버에서 타입이 재생성됨
+    ontology._object_type_name_to_id["Employee"] = "ot-old"
+
+    cls = ontology.load_object_type(name="Employee")
+
+    assert cls._object_type_id == "ot-1"
+    assert ontology._object_type_name_to_id["Employee"] == "ot-1"
+    assert len(_calls_to(session, OBJECT_TYPE)) == 1
+
+
+def test_explicit_id_failure_is_not_retried_by_name(make_client):
+    client, session = make_client({
+        "/object-type/ot-old": FakeResponse(b"", status_code=404),
+        "/object-type-property/ot-old": FakeResponse(b"", status_code=404),
+    })
+
+    with pytest.raises(Exception, match="ObjectType 조회 실패"):
+        client.ontology.load_object_type(object_type_id="ot-old", name="Employee")
+    assert _calls_to(session, OBJECT_TYPE) == []
+
+
+def test_id_loads_share_one_executor(make_client):
+    client, _ = make_client({
+        "/object-type/ot-1": {"id": "ot-1", "name": "Employee"},
+        "/object-type/ot-2": {"id": "ot-2", "name": "Ticket"},
+        "/object-type-property/ot-1": EMPLOYEE_PROPERTIES,
+        "/object-type-property/ot-2": {"status": True, "data": [{"name": "title"}]},
+    })
+    ontology = client.ontology
+
+    ontology.load_object_type(object_type_id="ot-1")
+    executor = ontology._executor
+    ticket = ontology.load_object_type(object_type_id="ot-2")
+
+    assert executor is not None and ontology._executor is executor
+    assert ticket._properties == ("title",)
+
+    client.close()
+    assert ontology._executor is None
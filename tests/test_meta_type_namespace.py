@@ -0,0 +1,37 @@
+"""MetaTypeNamespace 하위 API 지연 생성"""
+
+import threading
+
+from graphio_sdk.data_pipline import meta_type as meta_type_module
+
+
+def test_sub_apis_are_created_once_under_concurrency(make_client, monkeypatch):
+    client, _ = make_client({})
+    namespace = client.meta_type
+    created = []
+    barrier = threading.Barrier(8)
+    original = meta_type_module.EtcAPI
+
+    class SlowEtcAPI(original):
+        __slots__ = ()
+
+        def __init__(self, client):
+            created.append(self)
+            super().__init__(client)
+
+    monkeypatch.setattr(meta_type_module, "EtcAPI", SlowEtcAPI)
+    results = []
+
+    def access():
+        barrier.wait()
+        results.append(namespace.etc)
+
+    threads = [threading.Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(created) == 1
+    assert all(api is results[0] for api in results)
+    assert namespace.etc is results[0]
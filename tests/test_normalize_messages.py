@@ -0,0 +1,62 @@
+"""insert_batch 등의 입력 -> object message 변환 (_normalize_object_messages)"""
+
+from unittest.mock import Mock
+
+import pytest
+
+
+class _Contract:
+    def __init__(self, element_id):
+        self.element_id = element_id
+
+    def to_contract(self):
+        return {"objectTypeId": "ot-1", "elementId": self.element_id, "properties": {}}
+
+
+class _Proxy:
+    """to_message를 __getattr__로 위임하는 래퍼"""
+
+    def __init__(self, target):
+        self._target = target
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+def _normalize(client, objs):
+    return client.ontology._normalize_object_messages(
+        objs, require_element_id=False, method_name="insert_batch"
+    )
+
+
+def test_dict_and_class_level_converters(make_client):
+    client, _ = make_client({})
+    message = {"objectTypeId": "ot-1", "properties": {}}
+
+    assert _normalize(client, [message, _Contract("e1")]) == [
+        message,
+        {"objectTypeId": "ot-1", "elementId": "e1", "properties": {}},
+    ]
+
+
+def test_instance_level_converters_are_accepted(make_client):
+    client, _ = make_client({})
+    mock = Mock()
+    mock.to_contract.return_value = {"objectTypeId": "ot-1", "properties": {"a": 1}}
+    instance_attr = type("Plain", (), {})()
+    instance_attr.to_message = lambda: {"objectTypeId": "ot-2", "properties": {}}
+
+    messages = _normalize(client, [mock, _Proxy(_Contract("e2")), instance_attr])
+
+    assert messages == [
+        {"objectTypeId": "ot-1", "properties": {"a": 1}},
+        {"objectTypeId": "ot-1", "elementId": "e2", "properties": {}},
+        {"objectTypeId": "ot-2", "properties": {}},
+    ]
+
+
+def test_unsupported_items_raise_value_error(make_client):
+    client, _ = make_client({})
+
+    with pytest.raises(ValueError, match="to_contract"):
+        _normalize(client, [object()])
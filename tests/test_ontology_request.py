@@ -0,0 +1,69 @@
+"""
+ontology 서버 요청(_request/_fetch_*) 에러 감싸기 테스트
+"""
+
+import json
+
+import pytest
+import requests
+
+from tests.conftest import FakeResponse
+
+OBJECT_TYPE = "/graphio/v1/object-type"
+OBJECT_TYPE_BY_ID = "/graphio/v1/object-type/ot-1"
+PROPERTIES = "/graphio/v1/object-type-property/ot-1"
+SELECT = "/graphio/v1/ontology-workflow/objects/select"
+INSERT = "/graphio/v1/ontology-workflow/objects/insert"
+
+
+@pytest.mark.parametrize("fetch, route, label", [
+    (lambda ns: ns.fetch_object_types(), OBJECT_TYPE, "ObjectType 목록 조회"),
+    (lambda ns: ns._fetch_object_type_by_id("ot-1"), OBJECT_TYPE_BY_ID, "ObjectType 조회"),
+    (lambda ns: ns._fetch_object_type_properties("ot-1"), PROPERTIES, "ObjectType Properties 조회"),
+])
+def test_fetch_wraps_malformed_body(make_client, fetch, route, label):
+    client, _ = make_client({route: b"<html>502 Bad Gateway</html>"})
+
+    with pytest.raises(Exception) as exc_info:
+        fetch(client.ontology)
+
+    assert type(exc_info.value) is Exception
+    assert str(exc_info.value).startswith(f"{label} 실패: ")
+    assert isinstance(exc_info.value.__cause__, ValueError)
+
+
+def test_get_object_type_returns_none_on_malformed_body(make_client):
+    client, _ = make_client({OBJECT_TYPE: b"not json"})
+
+    assert client.ontology.get_object_type("Employee") is None
+
+
+def _raise_timeout(kwargs):
+    raise requests.Timeout("read timed out")
+
+
+@pytest.mark.parametrize("payload, prefix", [
+    (_raise_timeout, "데이터 조회 타임아웃 (timeout="),
+    (FakeResponse(b"", status_code=500), "데이터 조회 실패: 500 Error"),
+    (b"not json", "데이터 조회 실패: "),
+])
+def test_request_wraps_errors_with_label(make_client, payload, prefix):
+    client, _ = make_client({SELECT: payload})
+
+    with pytest.raises(Exception) as exc_info:
+        client.ontology._execute_select({"from": "ot-1"})
+
+    assert type(exc_info.value) is Exception
+    assert str(exc_info.value).startswith(prefix)
+    assert exc_info.value.__cause__ is not None
+
+
+def test_execute_write_sends_body_and_returns_data(make_client):
+    client, session = make_client({INSERT: {"status": True, "data": {"count": 1}}})
+
+    result = client.ontology._execute_create([{"objectTypeId": "ot-1", "properties": {}}])
+
+    assert result == {"count": 1}
+    method, _, kwargs = session.calls[0]
+    assert method == "POST"
+    assert json.loads(kwargs["data"]) == [{"objectTypeId": "ot-1", "properties": {}}]
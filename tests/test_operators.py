@@ -0,0 +1,53 @@
+"""Condition / LogicalCondition - 불변 조건과 to_dict 복사본"""
+
+import pytest
+
+from graphio_sdk.ontology.operators import Condition, LogicalCondition, PropertyDescriptor, QueryOp
+
+
+def test_condition_fields_are_read_only():
+    cond = Condition("age", QueryOp.GT, 30)
+    assert cond.to_dict() == {"field": "age", "op": "gt", "value": 30}
+    for name in ("field", "op", "value"):
+        with pytest.raises(AttributeError):
+            setattr(cond, name, None)
+    assert cond.to_dict() == {"field": "age", "op": "gt", "value": 30}
+
+
+def test_logical_condition_children_are_fixed():
+    children = [Condition("a", QueryOp.EQ, 1)]
+    logical = LogicalCondition("and", children)
+    children.append(Condition("b", QueryOp.EQ, 2))
+    logical.conditions.append(Condition("c", QueryOp.EQ, 3))  # 복사본이므로 영향 없음
+    assert len(logical.conditions) == 1
+    with pytest.raises(AttributeError):
+        logical.conditions = []
+    assert logical.to_dict() == {"and": [{"field": "a", "op": "eq", "value": 1}]}
+
+
+def test_is_in_copies_and_dedups_values():
+    values = ["Sales", "HR", "Sales"]
+    cond = PropertyDescriptor("department").is_in(values)
+    values.append("Marketing")
+    assert cond.value == ["Sales", "HR"]
+    cond.value.append("IT")
+    assert cond.to_dict() == {"field": "department", "op": "in", "value": ["Sales", "HR"]}
+
+
+def test_is_in_with_unhashable_values():
+    cond = PropertyDescriptor("tags").is_in([["a"], ["a"]])
+    assert cond.to_dict()["value"] == [["a"], ["a"]]
+
+
+def test_mutating_to_dict_result_does_not_touch_condition():
+    cond = PropertyDescriptor("department").is_in(["Sales"])
+    logical = LogicalCondition("or", [cond, Condition("age", QueryOp.GT, 30)])
+
+    cond.to_dict()["value"].append("HR")
+    logical.to_dict()["or"][0]["field"] = "changed"
+    logical.to_dict()["or"].pop()
+
+    assert logical.to_dict() == {"or": [
+        {"field": "department", "op": "in", "value": ["Sales"]},
+        {"field": "age", "op": "gt", "value": 30},
+    ]}
@@ -0,0 +1,53 @@
+"""count()/exists() 최소 조회 요청 (_probe_dto)"""
+
+import json
+
+import pytest
+
+from graphio_sdk.ontology.object_type import ObjectTypeBase
+from graphio_sdk.ontology.query import ObjectSetQuery
+
+SELECT = "/ontology-workflow/objects/select"
+
+
+def _sent_dto(session):
+    _method, _url, kwargs = session.calls[-1]
+    return json.loads(kwargs["data"])
+
+
+def test_exists_sends_one_field_with_limit_1(make_client):
+    client, session = make_client({SELECT: {"status": True, "data": [{"name": "a"}]}})
+    Employee = client.ontology.register_object_type("Employee", "ot-1", ["name", "age"])
+
+    assert Employee.where(Employee.age > 30).exists() is True
+    assert _sent_dto(session) == {
+        "select": ["name"],
+        "from": "ot-1",
+        "where": {"field": "age", "op": "gt", "value": 30},
+        "limit": 1,
+    }
+
+
+def test_exists_without_properties_falls_back_to_star(make_client):
+    client, session = make_client({SELECT: {"status": True, "data": []}})
+    Empty = client.ontology.register_object_type("Empty", "ot-2", [])
+
+    assert Empty.all().exists() is False
+    assert Empty.select("*").exists() is False
+    assert _sent_dto(session) == {"select": ["*"], "from": "ot-2", "limit": 1}
+
+
+def test_exists_without_namespace_raises_runtime_error_first():
+    class Detached(ObjectTypeBase):
+        _object_type_id = "ot-3"
+
+    with pytest.raises(RuntimeError):
+        ObjectSetQuery(Detached, None, None).exists()
+
+
+def test_count_without_properties_counts_star_rows(make_client):
+    client, session = make_client({SELECT: {"status": True, "data": [{}, {}, {}]}})
+    Empty = client.ontology.register_object_type("Empty", "ot-2", [])
+
+    assert Empty.select("*").count() == 3
+    assert _sent_dto(session) == {"select": ["*"], "from": "ot-2"}
@@ -0,0 +1,62 @@
+"""meta_type 읽기 전용 조회 응답 캐시 (_cached)"""
+
+TAGS = {"status": True, "data": [{"id": "t1", "name": "tag"}]}
+
+
+def test_cache_is_off_by_default(make_client):
+    client, session = make_client({"/meta-type/tag-list": TAGS})
+    client.meta_type.etc.tag_list()
+    client.meta_type.etc.tag_list()
+    assert len(session.calls) == 2
+
+
+def test_cached_result_is_reused(make_client):
+    client, session = make_client({"/meta-type/tag-list": TAGS}, cache_ttl=30)
+    client.meta_type.etc.tag_list()
+    client.meta_type.etc.tag_list()
+    assert len(session.calls) == 1
+
+
+def test_mutating_returned_dtos_does_not_touch_cache(make_client):
+    client, _session = make_client({"/meta-type/tag-list": TAGS}, cache_ttl=30)
+    tags = client.meta_type.etc.tag_list()
+    tags[0].name = "changed"
+    tags.append(tags[0])
+    again = client.meta_type.etc.tag_list()
+    assert [(t.id, t.name) for t in again] == [("t1", "tag")]
+
+
+def test_mutating_returned_dict_does_not_touch_cache(make_client):
+    client, _session = make_client(
+        {"/meta-type/meta-type-table/m1": {"status": True, "data": {"rows": [1, 2]}}}, cache_ttl=30
+    )
+    table = client.meta_type.table_data.meta_type_table("m1")
+    table["rows"].append(3)
+    assert client.meta_type.table_data.meta_type_table("m1") == {"rows": [1, 2]}
+
+
+def test_invalidate_cache_refetches(make_client):
+    client, session = make_client({"/meta-type/tag-list": TAGS}, cache_ttl=30)
+    client.meta_type.etc.tag_list()
+    client.meta_type.invalidate_cache()
+    client.meta_type.etc.tag_list()
+    assert len(session.calls) == 2
+
+
+def test_positional_and_keyword_calls_share_a_key(make_client):
+    client, session = make_client({"/meta-type/kind-list": {"status": True, "data": []}}, cache_ttl=30)
+    client.meta_type.manage.kind_list("TABLE")
+    client.meta_type.manage.kind_list(meta_type_kind="TABLE")
+    assert len(session.calls) == 1
+    assert len(client._response_cache) == 1
+
+
+def test_disabled_cache_returns_result_without_copy(make_client, monkeypatch):
+    client, _session = make_client({"/meta-type/tag-list": TAGS})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("캐시가 꺼져 있으면 복사하지 않아야 함")
+
+    monkeypatch.setattr("graphio_sdk.data_pipline.meta_type.copy.deepcopy", fail)
+    assert [t.id for t in client.meta_type.etc.tag_list()] == ["t1"]
+    assert len(client._response_cache) == 0